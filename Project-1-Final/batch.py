@@ -0,0 +1,270 @@
+# ============================================
+# Batch Command Driver
+# ============================================
+# Runs library commands without input() prompts. Commands are read as
+# JSON lines from a file or stdin, executed against the in-memory lists
+# (loaded once), and one JSON result line is written per command.
+#
+#   python batch.py commands.jsonl [commit_every]
+#   python batch.py - < commands.jsonl
+#   python batch.py --benchmark
+#
+# Commands ("id" is optional and copied to the result):
+#   {"op": "add", "book_id": "B1", "title": "...", "author": "...", "year": "2020"}
+#   {"op": "register", "member_id": "M1", "name": "...", "email": "..."}
+#   {"op": "borrow", "loan_id": "L1", "book_id": "B1", "member_id": "M1",
+#    "borrow_date": "2025-01-01", "due_date": "2025-01-15"}
+#   {"op": "return", "loan_id": "L1", "return_date": "2025-01-14"}
+#   {"op": "search", "type": "books" | "members", "keyword": "...", "top_k": 20}
+#
+# Saves are group-committed: the CSV files are written once every
+# `commit_every` changing commands (and at the end), and the results of
+# those commands are only written out after the save that includes them.
+
+import contextlib
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import book
+import loan
+import member
+import search
+
+COMMIT_EVERY = 100   # changing commands per save
+CHANGING_OPS = ("add", "register", "borrow", "return")
+
+
+# -------------------------------------------------
+# Commands: each takes the batch state and the command dict
+# -------------------------------------------------
+def _add(state, command):
+    return {"book": book.create_book(command.get("book_id", ""), command.get("title", ""),
+                                     command.get("author", ""), command.get("year", ""))}
+
+
+def _register(state, command):
+    new_member = member.create_member(state["members"], book.field_text(command.get("member_id", "")),
+                                      book.field_text(command.get("name", "")),
+                                      book.field_text(command.get("email", "")))
+    return {"member": new_member}
+
+
+def _borrow(state, command):
+    # Shard workers turn the member check off: the member may live on another shard
+    return {"loan": loan.create_loan(command.get("loan_id", ""), command.get("book_id", ""),
+                                     command.get("member_id", ""), command.get("borrow_date", ""),
+                                     command.get("due_date", ""),
+                                     members=state["members"] if state.get("check_members", True) else None)}
+
+
+def _return(state, command):
+    return {"loan": loan.close_loan(command.get("loan_id", ""), command.get("return_date", ""))}
+
+
+def _search(state, command):
+    keyword = book.field_text(command.get("keyword", ""))
+    top_k = int(command.get("top_k", search.TOP_K))
+    if keyword == "":
+        raise ValueError("Keyword cannot be empty.")
+
+    if command.get("type", "books") == "members":
+        return {"results": member.search_members(state["members"], keyword, top_k)}
+    return {"results": book.find_books(keyword, top_k)}
+
+
+COMMANDS = {
+    "add": _add,
+    "register": _register,
+    "borrow": _borrow,
+    "return": _return,
+    "search": _search,
+}
+
+
+# -------------------------------------------------
+# Run one command; errors become {"ok": false, "error": ...}
+# -------------------------------------------------
+def run_command(state, command):
+    result = {"id": command.get("id")} if "id" in command else {}
+    op = command.get("op")
+
+    if not isinstance(op, str) or op not in COMMANDS:
+        result.update(ok=False, error=f"Unknown op {op!r}. Use one of: {', '.join(COMMANDS)}.")
+        return result
+
+    # A bad field (wrong type, missing key) fails this command only, never the batch
+    try:
+        result.update(ok=True, op=op, **COMMANDS[op](state, command))
+    except ValueError as error:
+        result.update(ok=False, op=op, error=str(error))
+    except (TypeError, KeyError) as error:
+        result.update(ok=False, op=op, error=f"Invalid command field ({type(error).__name__}: {error}).")
+    return result
+
+
+# -------------------------------------------------
+# Helper: write the three CSV files
+# -------------------------------------------------
+def _save(state):
+    book.save_books()
+    member.save_members(state["members"])
+    loan.save_loans()
+    state["saves"] += 1
+
+
+# -------------------------------------------------
+# Run a stream of JSONL commands and write JSONL results to `out`
+# Module messages (Loaded/Saved ...) go to stderr so `out` stays JSONL.
+# -------------------------------------------------
+def run_batch(lines, out=sys.stdout, commit_every=COMMIT_EVERY, members=None):
+    state = {"members": members, "saves": 0}
+    pending = []    # result lines waiting for the next save
+    changes = 0     # changing commands since the last save
+    counts = {"commands": 0, "ok": 0, "failed": 0}
+
+    with contextlib.redirect_stdout(sys.stderr):
+        if state["members"] is None:
+            book.load_books()
+            state["members"] = member.load_members()
+            loan.load_loans()
+
+        for line_number, line in enumerate(lines, 1):
+            if line.strip() == "":
+                continue
+
+            try:
+                command = json.loads(line)
+                if not isinstance(command, dict):
+                    raise ValueError("A command must be a JSON object.")
+                result = run_command(state, command)
+            except ValueError as error:   # includes json.JSONDecodeError
+                command = {}
+                result = {"ok": False, "error": f"Line {line_number}: {error}"}
+
+            counts["commands"] += 1
+            counts["ok" if result["ok"] else "failed"] += 1
+            pending.append(json.dumps(result))
+
+            if result["ok"] and command.get("op") in CHANGING_OPS:
+                changes += 1
+            if changes >= commit_every:
+                _save(state)
+                changes = 0
+            if changes == 0:
+                out.write("\n".join(pending) + "\n")
+                pending = []
+
+        if changes > 0:
+            _save(state)
+        if pending:
+            out.write("\n".join(pending) + "\n")
+
+    out.flush()
+    counts["saves"] = state["saves"]
+    return counts
+
+
+# -------------------------------------------------
+# Point every module at another Datasets directory (returns the old paths)
+# -------------------------------------------------
+def use_datasets_dir(path):
+    saved = (book.BOOKS_FILE, member.MEMBERS_FILE, loan.LOANS_FILE,
+             loan.ARCHIVE_DIR, loan.ARCHIVE_INDEX_FILE, loan.ARCHIVE_IDS_FILE, loan._archived_ids)
+
+    archive_dir = os.path.join(path, "loans_archive")
+    book.BOOKS_FILE = os.path.join(path, "books.csv")
+    member.MEMBERS_FILE = os.path.join(path, "members.csv")
+    loan.LOANS_FILE = os.path.join(path, "loans.csv")
+    loan.ARCHIVE_DIR = archive_dir
+    loan.ARCHIVE_INDEX_FILE = os.path.join(archive_dir, "index.csv")
+    loan.ARCHIVE_IDS_FILE = os.path.join(archive_dir, "loan_ids.txt")
+    loan._archived_ids = None
+    return saved
+
+
+def restore_datasets_dir(saved):
+    (book.BOOKS_FILE, member.MEMBERS_FILE, loan.LOANS_FILE,
+     loan.ARCHIVE_DIR, loan.ARCHIVE_INDEX_FILE, loan.ARCHIVE_IDS_FILE, loan._archived_ids) = saved
+
+
+# -------------------------------------------------
+# Benchmark: commands/sec for different group-commit sizes
+# -------------------------------------------------
+def benchmark_batch(n_commands=2_000, n_books=10_000, n_members=5_000,
+                    commit_sizes=(1, 100, 1_000), seed=42):
+    rng = random.Random(seed)
+
+    # Commands: 30% borrow, 25% return, 20% search, 15% add, 10% register
+    commands = []
+    open_loans = []
+    next_book, next_member, next_loan = n_books, n_members, 0
+    for i in range(n_commands):
+        roll = rng.random()
+        if roll < 0.30:
+            commands.append({"op": "borrow", "loan_id": f"L{next_loan}", "book_id": f"B{rng.randrange(n_books)}",
+                             "member_id": f"M{rng.randrange(n_members)}",
+                             "borrow_date": "2026-10-01", "due_date": "2026-10-15"})
+            open_loans.append(f"L{next_loan}")
+            next_loan += 1
+        elif roll < 0.55 and open_loans:
+            commands.append({"op": "return", "loan_id": open_loans.pop(rng.randrange(len(open_loans))),
+                             "return_date": "2026-10-17"})
+        elif roll < 0.75:
+            commands.append({"op": "search", "type": rng.choice(["books", "members"]),
+                             "keyword": str(rng.randrange(n_members))})
+        elif roll < 0.90:
+            commands.append({"op": "add", "book_id": f"B{next_book}", "title": f"New Title {next_book}",
+                             "author": "Batch Author", "year": "2026"})
+            next_book += 1
+        else:
+            commands.append({"op": "register", "member_id": f"M{next_member}", "name": f"Member {next_member}",
+                             "email": f"m{next_member}@student.usm.my"})
+            next_member += 1
+    lines = [json.dumps(command) for command in commands]
+
+    results = []
+    for commit_every in commit_sizes:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            saved = use_datasets_dir(temp_dir)
+            try:
+                with open(book.BOOKS_FILE, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["book_id", "title", "author", "year", "available"])
+                    writer.writerows((f"B{i}", f"Book Title {i}", f"Author {i % 5000}", 1950 + i % 75, "yes")
+                                     for i in range(n_books))
+                with open(member.MEMBERS_FILE, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["member_id", "name", "email"])
+                    writer.writerows((f"M{i}", f"Member Name {i}", f"member{i}@student.usm.my")
+                                     for i in range(n_members))
+
+                start = time.perf_counter()
+                with open(os.devnull, "w") as out, contextlib.redirect_stderr(out):
+                    counts = run_batch(lines, out, commit_every=commit_every)
+                seconds = time.perf_counter() - start
+            finally:
+                restore_datasets_dir(saved)
+
+        results.append((commit_every, counts, seconds))
+        print(f"commit_every={commit_every:<5} {counts['commands'] / seconds:>8.0f} commands/sec "
+              f"({counts['ok']} ok, {counts['failed']} failed, {counts['saves']} save(s), {seconds:.2f}s)")
+
+    return results
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--benchmark"]:
+        benchmark_batch()
+    else:
+        source = sys.argv[1] if len(sys.argv) > 1 else "-"
+        commit_every = int(sys.argv[2]) if len(sys.argv) > 2 else COMMIT_EVERY
+        if source == "-":
+            run_batch(sys.stdin, commit_every=commit_every)
+        else:
+            with open(source, "r", encoding="utf-8") as f:
+                run_batch(f, commit_every=commit_every)
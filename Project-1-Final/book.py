@@ -5,6 +5,10 @@
 import csv
 import os
 
+import range_index
+import search
+import snapshot
+
 # Set up the Datasets directory in the same folder as this script
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATASETS_DIR = os.path.join(SCRIPT_DIR, "Datasets")
@@ -12,6 +16,9 @@ os.makedirs(DATASETS_DIR, exist_ok=True)
 
 BOOKS_FILE = os.path.join(DATASETS_DIR, "books.csv")
 books = []   # global list to store book records
+_search_index = None   # fuzzy search index over books, built on first search
+_year_index = None     # sorted index on year, built on first range query
+_id_index = None       # sorted index on book_id, built on first lookup
 
 # Load books from CSV
 def load_books():
@@ -43,12 +50,58 @@ def save_books():
     print(f"Saved {len(books)} book(s) to '{BOOKS_FILE}'.")
 
 
+# Helper: sorted index on book_id over the current books list
+def get_id_index():
+    global _id_index
+    if _id_index is None or _id_index["records"] is not books:
+        _id_index = range_index.build_index(books, "book_id")
+    return _id_index
+
+
+# Find a book by its ID (None if there is no such book)
+def find_book(book_id):
+    found = range_index.range_query(get_id_index(), book_id, book_id)
+    return found[0] if found else None
+
+
 # Helper: Check if book_id already exists
 def does_book_id_exist(book_id):
-    for book in books:
-        if book["book_id"] == book_id:
-            return True
-    return False
+    return find_book(book_id) is not None
+
+
+# Helper: stripped text of a field value; None and non-scalar values
+# (lists, dicts from JSON) become "" so the "cannot be empty" checks reject them
+def field_text(value):
+    if value is None or not isinstance(value, (str, int, float)):
+        return ""
+    return str(value).strip()
+
+
+# Add a new book without prompts (raises ValueError if a field is invalid)
+def create_book(book_id, title, author, year):
+    book_id, title, author, year = (field_text(value) for value in (book_id, title, author, year))
+
+    if book_id == "":
+        raise ValueError("Book ID cannot be empty.")
+    if does_book_id_exist(book_id):
+        raise ValueError("This Book ID already exists.")
+    if title == "":
+        raise ValueError("Title cannot be empty.")
+    if author == "":
+        raise ValueError("Author cannot be empty.")
+    if not year.isdigit():
+        raise ValueError("Year must be digits.")
+
+    new_book = {
+        "book_id": book_id,
+        "title": title,
+        "author": author,
+        "year": year,
+        "available": "yes"
+    }
+
+    books.append(new_book)
+    return new_book
 
 
 # Add a new book (with validation)
@@ -85,19 +138,16 @@ def add_book():
         else:
             break
 
-    new_book = {
-        "book_id": book_id,
-        "title": title,
-        "author": author,
-        "year": year,
-        "available": "yes"
-    }
-
-    books.append(new_book)
+    create_book(book_id, title, author, year)
     print(f"\nBook '{title}' has been added successfully!")
 
 
-# List all books
+# Point-in-time view of the books list (use with: `with book.books_snapshot() as snap:`)
+def books_snapshot():
+    return snapshot.open_snapshot("books", books)
+
+
+# List all books (as they were when the listing started)
 def list_books():
     print("\n=== List of Books ===")
 
@@ -108,9 +158,50 @@ def list_books():
     print(f"{'ID':<10} {'Title':<30} {'Author':<20} {'Year':<6} {'Available':<9}")
     print("-" * 80)
 
-    for book in books:
-        print(f"{book['book_id']:<10} {book['title']:<30} {book['author']:<20} "
-              f"{book['year']:<6} {book['available']:<9}")
+    with books_snapshot() as snap:
+        for book in snapshot.rows(snap):
+            print(f"{book['book_id']:<10} {book['title']:<30} {book['author']:<20} "
+                  f"{book['year']:<6} {book['available']:<9}")
+
+
+# Helper: search index over the current books list (new books are picked up automatically)
+def get_search_index():
+    global _search_index
+    if _search_index is None or _search_index["records"] is not books:
+        _search_index = search.build_index(books, ["title", "author"])
+    return _search_index
+
+
+# Change a book's availability ("yes" / "no") and drop the cached searches that return it
+def set_availability(book, available):
+    snapshot.write("books", book, "available", available)
+    if _search_index is not None:
+        search.invalidate_record(_search_index, book)
+
+
+# Search cache counters (hits, misses, evictions, ...)
+def search_cache_stats():
+    return search.cache_stats(get_search_index())
+
+
+# Find books by title or author (typo-tolerant, best matches first)
+def find_books(keyword, top_k=search.TOP_K):
+    return [book for score, book in search.search(get_search_index(), keyword, top_k)]
+
+
+# Helper: sorted index on year over the current books list
+def get_year_index():
+    global _year_index
+    if _year_index is None or _year_index["records"] is not books:
+        _year_index = range_index.build_index(books, "year", parse=int)
+    return _year_index
+
+
+# Find books published between from_year and to_year (inclusive, oldest first)
+def find_books_by_year(from_year=None, to_year=None):
+    return range_index.range_query(get_year_index(),
+                                   None if from_year is None else int(from_year),
+                                   None if to_year is None else int(to_year))
 
 
 # Search books (by title or author)
@@ -122,10 +213,10 @@ def search_books():
         print("Keyword cannot be empty.")
         return
 
-    results = []
-    for book in books:
-        if keyword in book["title"].lower() or keyword in book["author"].lower():
-            results.append(book)
+    # One extra result tells us whether the list was cut at TOP_K
+    results = find_books(keyword, search.TOP_K + 1)
+    truncated = len(results) > search.TOP_K
+    results = results[:search.TOP_K]
 
     if len(results) == 0:
         print("No matching books found.")
@@ -138,3 +229,6 @@ def search_books():
     for book in results:
         print(f"{book['book_id']:<10} {book['title']:<30} {book['author']:<20} "
               f"{book['year']:<6} {book['available']:<9}")
+
+    if truncated:
+        print(f"\nOnly the best {search.TOP_K} matches are shown. Use a more specific keyword to see others.")
@@ -0,0 +1,166 @@
+# ============================================
+# Startup Loader Module
+# ============================================
+# Loads books.csv, members.csv and loans.csv at the same time instead of
+# one after another. Large files are split into byte ranges (cut at line
+# boundaries) that are parsed on a process pool and joined in order.
+#
+# The result is exactly what the modules expose today:
+#   book.books, the members list, loan.loans
+
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import book
+import loan
+import member
+
+CHUNK_BYTES = 4 * 1024 * 1024           # size of one byte range
+PARALLEL_THRESHOLD = 8 * 1024 * 1024    # smaller files are parsed in one piece
+
+
+# -------------------------------------------------
+# Helper: parse the rows between two byte offsets
+# -------------------------------------------------
+def _parse_range(path, start, end, fieldnames):
+    with open(path, mode="rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+
+    return list(csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames))
+
+
+# -------------------------------------------------
+# Helper: header and byte ranges of a CSV file
+# Ranges end on a newline, so no row is cut in two
+# (rows with line breaks inside quoted fields are not supported).
+# -------------------------------------------------
+def _split_file(path, chunk_bytes):
+    size = os.path.getsize(path)
+
+    with open(path, mode="rb") as f:
+        header_line = f.readline()
+        fieldnames = next(csv.reader([header_line.decode("utf-8")]))
+
+        ranges = []
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()   # move to the end of the current line
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+
+    return fieldnames, ranges
+
+
+# -------------------------------------------------
+# Load all three tables concurrently
+# -------------------------------------------------
+def load_all(books_file=None, members_file=None, loans_file=None,
+             workers=None, chunk_bytes=CHUNK_BYTES):
+    files = {
+        "books": books_file or book.BOOKS_FILE,
+        "members": members_file or member.MEMBERS_FILE,
+        "loans": loans_file or loan.LOANS_FILE,
+    }
+
+    # members.csv is created with a header if missing (same as member.load_members)
+    if not os.path.exists(files["members"]):
+        with open(files["members"], "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(["member_id", "name", "email"])
+
+    # Split every existing file into jobs: (table, start, end, fieldnames)
+    jobs = []
+    total_bytes = 0
+    for table, path in files.items():
+        if not os.path.exists(path):
+            print(f"File '{path}' not found. Starting with empty list.")
+            continue
+
+        size = os.path.getsize(path)
+        total_bytes += size
+        step = chunk_bytes if size > PARALLEL_THRESHOLD else size + 1
+        fieldnames, ranges = _split_file(path, step)
+        jobs.extend((table, path, start, end, fieldnames) for start, end in ranges)
+
+    # Small inputs are parsed in process: starting a pool costs more than they take
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1) if total_bytes >= PARALLEL_THRESHOLD else 1
+
+    if workers <= 1 or len(jobs) <= 1:
+        parts = [_parse_range(path, start, end, fieldnames) for _, path, start, end, fieldnames in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_parse_range, path, start, end, fieldnames)
+                       for _, path, start, end, fieldnames in jobs]
+            parts = [future.result() for future in futures]
+
+    # Join the parts of each table in file order
+    tables = {"books": [], "members": [], "loans": []}
+    for job, rows in zip(jobs, parts):
+        tables[job[0]].extend(rows)
+
+    book.books = tables["books"]
+    loan.loans = tables["loans"]
+
+    print(f"Loaded {len(book.books)} book(s), {len(tables['members'])} member(s) "
+          f"and {len(loan.loans)} loan(s).")
+    return tables["members"]
+
+
+# -------------------------------------------------
+# Benchmark: sequential module loads vs load_all
+# -------------------------------------------------
+def benchmark_startup(n_books=200_000, n_members=100_000, n_loans=1_000_000, workers=None):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {name: os.path.join(temp_dir, f"{name}.csv") for name in ("books", "members", "loans")}
+
+        with open(paths["books"], "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["book_id", "title", "author", "year", "available"])
+            writer.writerows((f"B{i}", f"Book Title {i}", f"Author {i % 5000}", 1950 + i % 75, "yes")
+                             for i in range(n_books))
+
+        with open(paths["members"], "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["member_id", "name", "email"])
+            writer.writerows((f"M{i}", f"Member Name {i}", f"member{i}@student.usm.my") for i in range(n_members))
+
+        with open(paths["loans"], "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["loan_id", "book_id", "member_id", "borrow_date", "due_date", "return_date", "fine"])
+            writer.writerows((f"L{i}", f"B{i % n_books}", f"M{i % n_members}", "2025-01-01", "2025-01-15",
+                              "2025-01-14" if i % 3 else "", "0") for i in range(n_loans))
+
+        saved = (book.BOOKS_FILE, member.MEMBERS_FILE, loan.LOANS_FILE)
+        book.BOOKS_FILE, member.MEMBERS_FILE, loan.LOANS_FILE = paths["books"], paths["members"], paths["loans"]
+        try:
+            start = time.perf_counter()
+            book.load_books()
+            members_sequential = member.load_members()
+            loan.load_loans()
+            sequential_seconds = time.perf_counter() - start
+            expected = (book.books, members_sequential, loan.loans)
+
+            start = time.perf_counter()
+            members_parallel = load_all(workers=workers)
+            parallel_seconds = time.perf_counter() - start
+
+            if (book.books, members_parallel, loan.loans) != expected:
+                raise RuntimeError("load_all() returned different data than the module loaders.")
+        finally:
+            book.BOOKS_FILE, member.MEMBERS_FILE, loan.LOANS_FILE = saved
+
+    print(f"\nSequential load: {sequential_seconds:.3f}s")
+    print(f"load_all:        {parallel_seconds:.3f}s ({workers or os.cpu_count()} worker(s))")
+    return sequential_seconds, parallel_seconds
+
+
+if __name__ == "__main__":
+    benchmark_startup(workers=int(sys.argv[1]) if len(sys.argv) > 1 else None)
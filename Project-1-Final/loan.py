@@ -3,8 +3,15 @@
 # ============================================
 
 import csv
+import gzip
+import itertools
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import book
+import member
+import range_index
+import snapshot
 
 # Set up the Datasets directory in the same folder as this script
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -12,7 +19,25 @@ DATASETS_DIR = os.path.join(SCRIPT_DIR, "Datasets")
 os.makedirs(DATASETS_DIR, exist_ok=True)
 
 LOANS_FILE = os.path.join(DATASETS_DIR, "loans.csv")
-loans = []   # global list to store loan records
+loans = []   # global list to store loan records (open and recently returned)
+
+# Loans returned more than HOT_DAYS ago are moved out of loans.csv into
+# gzip-compressed monthly partitions (by return month) in loans_archive/
+ARCHIVE_DIR = os.path.join(DATASETS_DIR, "loans_archive")
+ARCHIVE_INDEX_FILE = os.path.join(ARCHIVE_DIR, "index.csv")
+ARCHIVE_IDS_FILE = os.path.join(ARCHIVE_DIR, "loan_ids.txt")
+HOT_DAYS = 30
+
+LOAN_FIELDS = ["loan_id", "book_id", "member_id", "borrow_date", "due_date", "return_date", "fine"]
+INDEX_FIELDS = ["month", "file", "rows"]
+
+_archived_ids = None   # loan IDs in the archive, read on first use
+
+# Date fields with a sorted index for range queries (built on first use)
+RANGE_FIELDS = ["borrow_date", "due_date", "return_date"]
+_range_indexes = {}   # field -> range index over loans (also "loan_id", for lookups)
+
+FINE_PER_DAY = 0.5
 
 # Load loans from CSV
 def load_loans():
@@ -31,12 +56,12 @@ def load_loans():
     print(f"Loaded {len(loans)} loan(s) from '{LOANS_FILE}'.")
 
 
-# Save loans to CSV
+# Save loans to CSV (old returned loans are archived first)
 def save_loans():
-    fieldnames = ["loan_id", "book_id", "member_id", "borrow_date", "due_date", "return_date", "fine"]
+    archive_returned_loans()
 
     with open(LOANS_FILE, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=LOAN_FIELDS)
         writer.writeheader()
         for loan in loans:
             writer.writerow(loan)
@@ -44,12 +69,278 @@ def save_loans():
     print(f"Saved {len(loans)} loan(s) to '{LOANS_FILE}'.")
 
 
-# Helper: Check if loan_id already exists
-def is_loan_id_exist(loan_id):
+# Load the archive index (month -> partition file and row count)
+def load_archive_index():
+    index = {}
+
+    if not os.path.exists(ARCHIVE_INDEX_FILE):
+        return index
+
+    with open(ARCHIVE_INDEX_FILE, mode="r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            row["rows"] = int(row["rows"])
+            index[row["month"]] = row
+
+    return index
+
+
+# Save the archive index (written to a temp file first, then swapped in)
+def save_archive_index(index):
+    temp_file = ARCHIVE_INDEX_FILE + ".tmp"
+
+    with open(temp_file, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=INDEX_FIELDS)
+        writer.writeheader()
+        for month in sorted(index):
+            writer.writerow(index[month])
+
+    os.replace(temp_file, ARCHIVE_INDEX_FILE)
+
+
+# Helper: Loan IDs already moved to the archive
+def get_archived_ids():
+    global _archived_ids
+
+    if _archived_ids is None:
+        _archived_ids = set()
+        if os.path.exists(ARCHIVE_IDS_FILE):
+            with open(ARCHIVE_IDS_FILE, mode="r", encoding="utf-8") as f:
+                _archived_ids = set(line.strip() for line in f if line.strip())
+
+    return _archived_ids
+
+
+# Move loans returned more than HOT_DAYS ago into the monthly archive
+def archive_returned_loans(today=None):
+    global loans
+    cutoff = (today or datetime.today()) - timedelta(days=HOT_DAYS)
+
+    hot_loans = []
+    cold_loans = {}   # "YYYY-MM" -> list of loans
+    already_archived = 0
     for loan in loans:
-        if loan["loan_id"] == loan_id:
-            return True
-    return False
+        try:
+            returned = datetime.strptime(loan["return_date"], "%Y-%m-%d") if loan["return_date"] != "" else None
+        except ValueError:
+            returned = None
+
+        # Month taken from the parsed date, so "2026-1-8" goes to "2026-01"
+        if returned is None or returned >= cutoff:
+            hot_loans.append(loan)
+        elif loan["loan_id"] in get_archived_ids():
+            # Archived by a save that crashed before loans.csv was rewritten
+            already_archived += 1
+        else:
+            cold_loans.setdefault(returned.strftime("%Y-%m"), []).append(loan)
+
+    if len(cold_loans) == 0:
+        if already_archived:
+            loans = hot_loans
+            _range_indexes.clear()
+        return 0
+
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    index = load_archive_index()
+
+    for month in sorted(cold_loans):
+        file_name = f"loans-{month}.csv.gz"
+        partition_file = os.path.join(ARCHIVE_DIR, file_name)
+        is_new = not os.path.exists(partition_file)
+
+        # Appending adds a new gzip member; readers see one continuous CSV
+        with gzip.open(partition_file, mode="at", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=LOAN_FIELDS)
+            if is_new:
+                writer.writeheader()
+            writer.writerows(cold_loans[month])
+
+        entry = index.setdefault(month, {"month": month, "file": file_name, "rows": 0})
+        entry["rows"] += len(cold_loans[month])
+
+    archived_ids = [loan["loan_id"] for month in cold_loans for loan in cold_loans[month]]
+    with open(ARCHIVE_IDS_FILE, mode="a", encoding="utf-8") as f:
+        for loan_id in archived_ids:
+            f.write(loan_id + "\n")
+    if _archived_ids is not None:
+        _archived_ids.update(archived_ids)
+
+    save_archive_index(index)
+    loans = hot_loans   # a new list: open snapshots keep reading the old one
+    _range_indexes.clear()
+
+    print(f"Archived {len(archived_ids)} returned loan(s) into {len(cold_loans)} monthly partition(s).")
+    return len(archived_ids)
+
+
+# Load archived loans, optionally only for months in [from_month, to_month] ("YYYY-MM")
+def load_archived_loans(from_month=None, to_month=None):
+    archived = []
+
+    for month, entry in sorted(load_archive_index().items()):
+        if (from_month and month < from_month) or (to_month and month > to_month):
+            continue
+
+        with gzip.open(os.path.join(ARCHIVE_DIR, entry["file"]), mode="rt", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                archived.append(row)
+
+    return archived
+
+
+# Helper: sorted index on one of the RANGE_FIELDS over the current loans list
+def get_range_index(field):
+    if field not in RANGE_FIELDS:
+        raise ValueError(f"No range index on '{field}'. Use one of: {', '.join(RANGE_FIELDS)}.")
+
+    index = _range_indexes.get(field)
+    if index is None or index["records"] is not loans:
+        index = range_index.build_index(loans, field, parse=_date_text)
+        _range_indexes[field] = index
+    return index
+
+
+# Helper: date or date text -> zero-padded "YYYY-MM-DD" text (None stays None)
+# Dates typed as e.g. "2026-1-9" are accepted by strptime, so they are padded
+# here to sort correctly as text (raises ValueError for an invalid date).
+def _date_text(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if len(value) == 10 and value[4] == "-" and value[7] == "-":
+            return value
+        value = datetime.strptime(value, "%Y-%m-%d")
+    return value.strftime("%Y-%m-%d")
+
+
+# Find loans whose `field` date is between start and end (inclusive, earliest first)
+def find_loans(field, start=None, end=None):
+    return range_index.range_query(get_range_index(field), _date_text(start), _date_text(end))
+
+
+# Find open loans due within the next `days` days (overdue ones are not included)
+def find_loans_due_soon(days=3, today=None):
+    today = today or datetime.today()
+    due = find_loans("due_date", today, today + timedelta(days=days))
+    return [loan for loan in due if loan["return_date"] == ""]
+
+
+# Set a field of a loan, keeping its range index (if built) up to date
+def set_loan_field(loan, field, value):
+    index = _range_indexes.get(field)
+    if index is None or index["records"] is not loans:
+        snapshot.write("loans", loan, field, value)
+        return
+
+    range_index.remove_record(index, loan)
+    snapshot.write("loans", loan, field, value)
+    range_index.insert_record(index, loan)
+
+
+# Point-in-time view of the loans list (use with: `with loan.loans_snapshot() as snap:`)
+def loans_snapshot():
+    return snapshot.open_snapshot("loans", loans)
+
+
+# Find a loan in loans.csv by its ID (None if not found; archived loans are not searched)
+def find_loan(loan_id):
+    index = _range_indexes.get("loan_id")
+    if index is None or index["records"] is not loans:
+        index = range_index.build_index(loans, "loan_id")
+        _range_indexes["loan_id"] = index
+
+    found = range_index.range_query(index, loan_id, loan_id)
+    return found[0] if found else None
+
+
+# Helper: Check if loan_id already exists (open, recent or archived)
+def is_loan_id_exist(loan_id):
+    return find_loan(loan_id) is not None or loan_id in get_archived_ids()
+
+
+# Helper: check a "YYYY-MM-DD" date (raises ValueError)
+def _check_date(value, label):
+    if value == "":
+        raise ValueError(f"{label} cannot be empty.")
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError("Invalid date format. Please use YYYY-MM-DD.")
+
+
+# Days late and fine for a loan due on due_date and returned on return_date
+def calculate_fine(due_date, return_date):
+    days_late = (datetime.strptime(return_date, "%Y-%m-%d") - datetime.strptime(due_date, "%Y-%m-%d")).days
+    if days_late <= 0:
+        return 0, 0
+    return days_late, days_late * FINE_PER_DAY
+
+
+# Create a loan without prompts (raises ValueError if invalid)
+# The book must exist and be available; it is marked as unavailable.
+# When `members` is given, the member must be in it.
+def create_loan(loan_id, book_id, member_id, borrow_date, due_date, members=None):
+    loan_id, book_id, member_id, borrow_date, due_date = \
+        (book.field_text(value) for value in (loan_id, book_id, member_id, borrow_date, due_date))
+
+    if loan_id == "":
+        raise ValueError("Loan ID cannot be empty.")
+    if is_loan_id_exist(loan_id):
+        raise ValueError("This Loan ID already exists.")
+    if book_id == "":
+        raise ValueError("Book ID cannot be empty.")
+    if member_id == "":
+        raise ValueError("Member ID cannot be empty.")
+    borrow_date = _check_date(borrow_date, "Borrow Date").strftime("%Y-%m-%d")
+    due_date = _check_date(due_date, "Due Date").strftime("%Y-%m-%d")
+
+    found_book = book.find_book(book_id)
+    if found_book is None:
+        raise ValueError(f"Book ID '{book_id}' does not exist.")
+    if found_book["available"].lower() != "yes":
+        raise ValueError(f"Book '{found_book['title']}' is not available for borrowing.")
+
+    if members is not None:
+        if member.find_member(members, member_id) is None:
+            raise ValueError(f"Member ID '{member_id}' does not exist.")
+
+    new_loan = {
+        "loan_id": loan_id,
+        "book_id": book_id,
+        "member_id": member_id,
+        "borrow_date": borrow_date,
+        "due_date": due_date,
+        "return_date": "",
+        "fine": "0"
+    }
+
+    loans.append(new_loan)
+    book.set_availability(found_book, "no")
+    return new_loan
+
+
+# Close a loan without prompts (raises ValueError if invalid)
+# The fine is calculated and the book is marked as available again.
+def close_loan(loan_id, return_date):
+    loan_id, return_date = book.field_text(loan_id), book.field_text(return_date)
+
+    if loan_id == "":
+        raise ValueError("Loan ID cannot be empty.")
+    loan_found = find_loan(loan_id)
+    if loan_found is None:
+        raise ValueError(f"Loan ID '{loan_id}' not found.")
+    if loan_found["return_date"] != "":
+        raise ValueError(f"This book has already been returned on {loan_found['return_date']}.")
+    return_date = _check_date(return_date, "Return Date").strftime("%Y-%m-%d")
+
+    days_late, fine = calculate_fine(loan_found["due_date"], return_date)
+    set_loan_field(loan_found, "return_date", return_date)
+    set_loan_field(loan_found, "fine", str(fine))
+
+    found_book = book.find_book(loan_found["book_id"])
+    if found_book is not None:
+        book.set_availability(found_book, "yes")
+
+    return loan_found
 
 
 # Borrow a book
@@ -106,17 +397,12 @@ def borrow_book():
             except ValueError:
                 print("Invalid date format. Please use YYYY-MM-DD.")
 
-    new_loan = {
-        "loan_id": loan_id,
-        "book_id": book_id,
-        "member_id": member_id,
-        "borrow_date": borrow_date,
-        "due_date": due_date,
-        "return_date": "",
-        "fine": "0"
-    }
+    try:
+        create_loan(loan_id, book_id, member_id, borrow_date, due_date)
+    except ValueError as error:
+        print(error)
+        return
 
-    loans.append(new_loan)
     print(f"\nLoan '{loan_id}' has been created successfully!")
 
 
@@ -127,11 +413,7 @@ def return_book():
     loan_id = input("Enter Loan ID to return: ").strip()
 
     # Find the loan
-    loan_found = None
-    for loan in loans:
-        if loan["loan_id"] == loan_id:
-            loan_found = loan
-            break
+    loan_found = find_loan(loan_id)
 
     if loan_found is None:
         print(f"Loan ID '{loan_id}' not found.")
@@ -153,38 +435,34 @@ def return_book():
             except ValueError:
                 print("Invalid date format. Please use YYYY-MM-DD.")
 
-    # Calculate fine if return date is after due date
-    due_date_obj = datetime.strptime(loan_found["due_date"], "%Y-%m-%d")
-    return_date_obj = datetime.strptime(return_date, "%Y-%m-%d")
+    # Update the loan (fine is calculated if return date is after due date)
+    close_loan(loan_id, return_date)
 
-    fine = 0
-    if return_date_obj > due_date_obj:
-        days_late = (return_date_obj - due_date_obj).days
-        fine = days_late * 0.5
+    days_late, fine = calculate_fine(loan_found["due_date"], return_date)
+    if days_late > 0:
         print(f"\nBook is {days_late} day(s) late. Fine: MYR {fine:.2f}")
     else:
         print("\nBook returned on time. No fine.")
 
-    # Update the loan
-    loan_found["return_date"] = return_date
-    loan_found["fine"] = str(fine)
-
     print(f"Loan '{loan_id}' has been updated successfully!")
 
 
-# List all loans
-def list_loans():
+# List all loans as they were when the listing started (archived loans only when asked)
+def list_loans(include_archive=False, from_month=None, to_month=None):
     print("\n=== List of Loans ===")
 
-    if len(loans) == 0:
-        print("No loans available.")
-        return
+    with loans_snapshot() as snap:
+        archived = load_archived_loans(from_month, to_month) if include_archive else []
 
-    print(f"{'Loan ID':<10} {'Book ID':<10} {'Member ID':<12} {'Borrow':<12} {'Due':<12} {'Return':<12} {'Fine':<8}")
-    print("-" * 90)
+        if len(archived) == 0 and snap["length"] == 0:
+            print("No loans available.")
+            return
 
-    for loan in loans:
-        return_date = loan["return_date"] if loan["return_date"] else "Not returned"
-        fine = f"MYR {loan['fine']}" if loan["fine"] else "MYR 0"
-        print(f"{loan['loan_id']:<10} {loan['book_id']:<10} {loan['member_id']:<12} "
-              f"{loan['borrow_date']:<12} {loan['due_date']:<12} {return_date:<12} {fine:<8}")
+        print(f"{'Loan ID':<10} {'Book ID':<10} {'Member ID':<12} {'Borrow':<12} {'Due':<12} {'Return':<12} {'Fine':<8}")
+        print("-" * 90)
+
+        for loan in itertools.chain(archived, snapshot.rows(snap)):
+            return_date = loan["return_date"] if loan["return_date"] else "Not returned"
+            fine = f"MYR {loan['fine']}" if loan["fine"] else "MYR 0"
+            print(f"{loan['loan_id']:<10} {loan['book_id']:<10} {loan['member_id']:<12} "
+                  f"{loan['borrow_date']:<12} {loan['due_date']:<12} {return_date:<12} {fine:<8}")
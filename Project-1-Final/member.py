@@ -6,12 +6,17 @@ import csv
 import os
 import re
 
+import range_index
+import search
+
 # Set up the Datasets directory in the same folder as this script
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATASETS_DIR = os.path.join(SCRIPT_DIR, "Datasets")
 os.makedirs(DATASETS_DIR, exist_ok=True)
 
 MEMBERS_FILE = os.path.join(DATASETS_DIR, "members.csv")
+_search_index = None   # fuzzy search index over the members list, built on first search
+_id_index = None       # sorted index on member_id, built on first lookup
 
 # Creating File
 def initialize_members_file():
@@ -50,28 +55,35 @@ def is_valid_email(email):
     return re.match(pattern, email) is not None
 
 
+# FIND MEMBER BY ID (None if not found)
+def find_member(data, member_id):
+    global _id_index
+    if _id_index is None or _id_index["records"] is not data:
+        _id_index = range_index.build_index(data, "member_id")
+
+    found = range_index.range_query(_id_index, member_id, member_id)
+    return found[0] if found else None
+
+
 # CHECK DUPLICATE MEMBER ID
 def does_member_id_exist(data, member_id):
-    return any(m["member_id"] == member_id for m in data)
+    return find_member(data, member_id) is not None
 
 
-# REGISTER MEMBER
-def register_member(data, member_id, name, email):
+# CREATE MEMBER without printing (raises ValueError if invalid)
+def create_member(data, member_id, name, email):
 
     # Blank checks
     if not member_id or not name or not email:
-        print("❌ member_id, name, and email cannot be blank.")
-        return False
+        raise ValueError("member_id, name, and email cannot be blank.")
 
     # Duplicate ID check
     if does_member_id_exist(data, member_id):
-        print("❌ Member ID already exists!")
-        return False
+        raise ValueError("Member ID already exists!")
 
     # Email format validation
     if not is_valid_email(email):
-        print("❌ Invalid email format.")
-        return False
+        raise ValueError("Invalid email format.")
 
     # Add to dataframe
     new_member = {
@@ -81,6 +93,17 @@ def register_member(data, member_id, name, email):
     }
 
     data.append(new_member)
+    return new_member
+
+
+# REGISTER MEMBER
+def register_member(data, member_id, name, email):
+    try:
+        create_member(data, member_id, name, email)
+    except ValueError as error:
+        print(f"❌ {error}")
+        return False
+
     print("✅ Member registered successfully!")
     return True
 
@@ -96,16 +119,20 @@ def list_members(data):
         print(f"ID: {m['member_id']} | Name: {m['name']} | Email: {m['email']}")
 
 
-# SEARCH MEMBERS
-def search_members(data, keyword):
-    print("\n--- Search Results ---")
-    keyword = keyword.lower()
-    results = []
+# Helper: search index over a members list (new members are picked up automatically)
+def get_search_index(data):
+    global _search_index
+    if _search_index is None or _search_index["records"] is not data:
+        _search_index = search.build_index(data, ["member_id", "name", "email"])
+    return _search_index
 
-    for m in data:
-        if keyword in m["member_id"].lower() or \
-           keyword in m["name"].lower() or \
-           keyword in m["email"].lower():
-            results.append(m)
 
-    return results
+# SEARCH CACHE COUNTERS (hits, misses, evictions, ...)
+def search_cache_stats(data):
+    return search.cache_stats(get_search_index(data))
+
+
+# SEARCH MEMBERS (typo-tolerant, best matches first)
+def search_members(data, keyword, top_k=search.TOP_K):
+    print("\n--- Search Results ---")
+    return [m for score, m in search.search(get_search_index(data), keyword, top_k)]
@@ -0,0 +1,178 @@
+# ============================================
+# Range Index Module
+# ============================================
+# Sorted secondary index over one field of a list of records, used for
+# range queries such as "books published 2000-2010" or "loans due in the
+# next 3 days" without scanning and parsing every row:
+#   - keys are kept in a sorted list, next to the matching records
+#   - a range query is two binary searches plus the k rows in between
+#     (O(log n + k))
+# Records appended to the list are picked up on the next query; an in-place
+# change of the indexed field is remove_record(), then the write (through
+# snapshot.write, as in loan.set_loan_field), then insert_record().
+
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+BULK_THRESHOLD = 64   # more new records than this (and 1/8 of the index): re-sort instead of inserting
+
+
+# -------------------------------------------------
+# Helper: index key of a record (None when the field is empty or invalid)
+# -------------------------------------------------
+def _key(index, record):
+    value = record.get(index["field"], "")
+    if value == "" or value is None:
+        return None
+    try:
+        return index["parse"](value)
+    except ValueError:
+        return None
+
+
+# -------------------------------------------------
+# Build a range index over `field` of a list of records (list of dicts)
+# `parse` turns the stored text into a comparable key (e.g. int for years;
+# "YYYY-MM-DD" dates already sort correctly as text)
+# -------------------------------------------------
+def build_index(records, field, parse=str):
+    index = {
+        "records": records,   # the indexed list itself (new rows are picked up later)
+        "field": field,
+        "parse": parse,
+        "size": 0,            # number of records indexed so far
+        "keys": [],           # sorted keys
+        "rows": [],           # rows[i] is the record with key keys[i]
+    }
+    sync_index(index)
+    return index
+
+
+# -------------------------------------------------
+# Helper: sort every record of the list into the index again
+# -------------------------------------------------
+def _rebuild(index):
+    records = index["records"]
+    pairs = [(key, record) for key, record in ((_key(index, r), r) for r in records) if key is not None]
+    pairs.sort(key=lambda pair: pair[0])   # stable: equal keys stay in list order
+
+    index["keys"] = [key for key, _ in pairs]
+    index["rows"] = [record for _, record in pairs]
+    index["size"] = len(records)
+
+
+# -------------------------------------------------
+# Index any records appended to the list since the last call
+# (the whole index is rebuilt if records were removed)
+# -------------------------------------------------
+def sync_index(index):
+    records = index["records"]
+    size = index["size"]
+    new_count = len(records) - size
+
+    if new_count == 0:
+        return
+    if new_count < 0 or new_count > max(BULK_THRESHOLD, len(index["keys"]) // 8):
+        _rebuild(index)
+        return
+
+    for record in records[size:]:
+        insert_record(index, record)
+    index["size"] = len(records)
+
+
+# -------------------------------------------------
+# Add / remove one record under its current key
+# -------------------------------------------------
+def insert_record(index, record):
+    key = _key(index, record)
+    if key is None:
+        return
+    position = bisect_right(index["keys"], key)
+    index["keys"].insert(position, key)
+    index["rows"].insert(position, record)
+
+
+def remove_record(index, record):
+    sync_index(index)
+    key = _key(index, record)
+    if key is None:
+        return
+    keys, rows = index["keys"], index["rows"]
+    for position in range(bisect_left(keys, key), bisect_right(keys, key)):
+        if rows[position] is record:
+            del keys[position]
+            del rows[position]
+            return
+
+
+# -------------------------------------------------
+# Records with low <= key <= high (either bound may be None), in key order
+# -------------------------------------------------
+def range_query(index, low=None, high=None):
+    sync_index(index)
+    keys = index["keys"]
+    start = 0 if low is None else bisect_left(keys, low)
+    end = len(keys) if high is None else bisect_right(keys, high)
+    return index["rows"][start:end]
+
+
+# -------------------------------------------------
+# Number of records with low <= key <= high (O(log n))
+# -------------------------------------------------
+def count_range(index, low=None, high=None):
+    sync_index(index)
+    keys = index["keys"]
+    start = 0 if low is None else bisect_left(keys, low)
+    end = len(keys) if high is None else bisect_right(keys, high)
+    return max(end - start, 0)
+
+
+# -------------------------------------------------
+# Benchmark: "loans borrowed in one week" by scanning vs the index
+# -------------------------------------------------
+def benchmark_range_queries(n_loans=1_000_000, n_queries=20, seed=42):
+    rng = random.Random(seed)
+    first_day = date(2020, 1, 1)
+    loans = []
+    for i in range(n_loans):
+        borrowed = first_day + timedelta(days=rng.randrange(5 * 365))
+        loans.append({"loan_id": f"L{i}", "borrow_date": borrowed.isoformat(),
+                      "due_date": (borrowed + timedelta(days=14)).isoformat()})
+
+    start = time.perf_counter()
+    index = build_index(loans, "borrow_date")
+    build_seconds = time.perf_counter() - start
+
+    weeks = [first_day + timedelta(days=rng.randrange(5 * 365 - 7)) for _ in range(n_queries)]
+
+    start = time.perf_counter()
+    expected = []
+    for week_start in weeks:
+        low = datetime.combine(week_start, datetime.min.time())
+        high = low + timedelta(days=6)
+        expected.append([loan for loan in loans
+                         if low <= datetime.strptime(loan["borrow_date"], "%Y-%m-%d") <= high])
+    scan_ms = (time.perf_counter() - start) / n_queries * 1000
+
+    start = time.perf_counter()
+    found = [range_query(index, week_start.isoformat(), (week_start + timedelta(days=6)).isoformat())
+             for week_start in weeks]
+    index_ms = (time.perf_counter() - start) / n_queries * 1000
+
+    if [sorted(r["loan_id"] for r in rows) for rows in found] != \
+            [sorted(r["loan_id"] for r in rows) for rows in expected]:
+        raise RuntimeError("range_query() returned different loans than the scan.")
+
+    print(f"Loans: {n_loans}, queries: {n_queries} (one week each, ~{len(found[0])} rows)")
+    print(f"Index build:   {build_seconds:.2f}s")
+    print(f"Scan + parse:  {scan_ms:.1f} ms/query")
+    print(f"range_query:   {index_ms:.3f} ms/query")
+    return build_seconds, scan_ms, index_ms
+
+
+if __name__ == "__main__":
+    benchmark_range_queries(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,484 @@
+# ============================================
+# Fuzzy Search Module
+# ============================================
+# Typo-tolerant, ranked search used by book.search_books() and
+# member.search_members().
+#
+#   1. Every record field is split into lowercase words (terms).
+#   2. A trigram index over the vocabulary finds candidate terms for each
+#      query word; each candidate is checked with edit distance
+#      (exact, prefix, substring or up to 1-2 typos).
+#   3. Matching records are ranked with BM25 and the top-k are returned.
+#   4. Results are kept in a small LRU cache keyed by the normalised query.
+#      When a record is added or changed, only the cached queries that
+#      match one of its words are evicted.
+#   5. A query with no letters or digits (e.g. "@"), or only words too short
+#      to match inside other words (e.g. "07"), falls back to the old
+#      substring scan over the fields.
+#
+# Sharded search (shards.py) scores in two phases: term_stats() on every
+# shard, merge_term_stats() on the coordinator, then search() with the
+# merged `stats`, so all shards use the same IDF and average length and
+# their scores can be compared.
+#
+# Posting lists are compact arrays, and very common terms only re-score
+# records already found through rarer terms, so query time stays bounded
+# on large catalogues.
+
+import heapq
+import math
+import random
+import re
+import string
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+
+TOP_K = 20
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_EXPANSIONS = 20          # candidate terms kept per query word
+MAX_SCAN_POSTINGS = 20_000   # postings scanned for a very common term
+CACHE_SIZE = 256             # cached queries per index (least recently used are dropped)
+
+# How much a match counts compared to an exact word match
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.8
+SUBSTRING_WEIGHT = 0.6
+TYPO_WEIGHT = 0.7
+
+MIN_SUBSTRING_LENGTH = 3    # shorter query words only match as whole words or prefixes
+
+_WORD_PATTERN = re.compile(r"\w+")   # Unicode word characters ("müller" is one word, not "m" + "ller")
+
+
+# -------------------------------------------------
+# Helper: split text into lowercase words
+# -------------------------------------------------
+def tokenize(text):
+    return _WORD_PATTERN.findall(str(text).lower())
+
+
+# -------------------------------------------------
+# Helper: trigrams of a word ("$" marks start and end)
+# -------------------------------------------------
+def _trigrams(term):
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# -------------------------------------------------
+# Helper: edit distance with early exit once it exceeds max_distance
+# -------------------------------------------------
+def edit_distance(a, b, max_distance):
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if max_distance == 1:
+        return _one_edit_distance(a, b)
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return previous[-1]
+
+
+# -------------------------------------------------
+# Helper: edit_distance(a, b, 1) in one pass (0, 1, or 2 for "more than 1")
+# -------------------------------------------------
+def _one_edit_distance(a, b):
+    if a == b:
+        return 0
+
+    i = 0
+    while i < len(a) and i < len(b) and a[i] == b[i]:
+        i += 1
+
+    if len(a) == len(b):
+        same_rest = a[i + 1:] == b[i + 1:]    # one substitution
+    elif len(a) < len(b):
+        same_rest = a[i:] == b[i + 1:]        # one insertion
+    else:
+        same_rest = a[i + 1:] == b[i:]        # one deletion
+    return 1 if same_rest else 2
+
+
+# -------------------------------------------------
+# Helper: typos allowed for a query word of this length
+# -------------------------------------------------
+def _max_typos(word):
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 7:
+        return 1
+    return 2
+
+
+# -------------------------------------------------
+# Build a search index over a list of records (list of dicts)
+# -------------------------------------------------
+def build_index(records, fields, cache_size=CACHE_SIZE):
+    index = {
+        "records": records,       # the indexed list itself (new rows are picked up later)
+        "fields": fields,
+        "size": 0,                # number of records indexed so far
+        "postings": {},           # term -> array of record positions (repeated for tf > 1)
+        "doc_lengths": array("I"),
+        "total_length": 0,
+        "trigrams": {},           # trigram -> set of terms
+        "sorted_terms": [],       # vocabulary in sorted order (prefix lookups)
+        "sorted_dirty": False,
+        "cache": {
+            "entries": OrderedDict(),   # (query words, top_k) -> results
+            "max_entries": cache_size,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,             # dropped because the cache was full
+            "invalidations": 0,         # dropped because a matching record changed
+        },
+    }
+    sync_index(index)
+    return index
+
+
+# -------------------------------------------------
+# Index one record (appended at position `position`)
+# -------------------------------------------------
+def add_record(index, record, position=None):
+    if position is None:
+        position = index["size"]
+
+    terms = _record_terms(index, record)
+    _invalidate_terms(index, terms)
+
+    postings = index["postings"]
+    for term in terms:
+        if term not in postings:
+            postings[term] = array("I")
+            for trigram in _trigrams(term):
+                index["trigrams"].setdefault(trigram, set()).add(term)
+            index["sorted_dirty"] = True
+        postings[term].append(position)
+
+    index["doc_lengths"].append(len(terms))
+    index["total_length"] += len(terms)
+    index["size"] = position + 1
+
+
+# -------------------------------------------------
+# Helper: words of a record in the indexed fields
+# -------------------------------------------------
+def _record_terms(index, record):
+    terms = []
+    for field in index["fields"]:
+        terms.extend(tokenize(record.get(field, "")))
+    return terms
+
+
+# -------------------------------------------------
+# Index any records appended to the list since the last call
+# -------------------------------------------------
+def sync_index(index):
+    records = index["records"]
+    for position in range(index["size"], len(records)):
+        add_record(index, records[position], position)
+
+
+# -------------------------------------------------
+# Helper: would `word` in a query match `term` (same rules as _match_terms)
+# The same pairs come up again and again, so answers are memoised.
+# -------------------------------------------------
+@lru_cache(maxsize=65_536)
+def _word_matches_term(word, term):
+    if term.startswith(word) or (len(word) >= 3 and word in term):
+        return True
+    max_typos = _max_typos(word)
+    return max_typos > 0 and edit_distance(word, term, max_typos) <= max_typos
+
+
+# -------------------------------------------------
+# Helper: evict cached queries that match any of `terms`
+# -------------------------------------------------
+def _invalidate_terms(index, terms):
+    cache = index["cache"]
+    if not cache["entries"] or not terms:
+        return
+
+    terms = set(terms)
+    words = {word for key in cache["entries"] for word in key[0]}
+    matching = {word for word in words if any(_word_matches_term(word, term) for term in terms)}
+    stale = [key for key in cache["entries"] if not matching.isdisjoint(key[0])]
+    for key in stale:
+        del cache["entries"][key]
+    cache["invalidations"] += len(stale)
+
+
+# -------------------------------------------------
+# A record changed in place (e.g. its availability): evict the cached
+# queries that match it
+# -------------------------------------------------
+def invalidate_record(index, record):
+    _invalidate_terms(index, _record_terms(index, record))
+
+
+# -------------------------------------------------
+# Cache counters, to help choose CACHE_SIZE
+# -------------------------------------------------
+def cache_stats(index):
+    cache = index["cache"]
+    lookups = cache["hits"] + cache["misses"]
+    return {
+        "size": len(cache["entries"]),
+        "max_entries": cache["max_entries"],
+        "hits": cache["hits"],
+        "misses": cache["misses"],
+        "evictions": cache["evictions"],
+        "invalidations": cache["invalidations"],
+        "hit_rate": cache["hits"] / lookups if lookups else 0.0,
+    }
+
+
+# -------------------------------------------------
+# Helper: vocabulary terms matching one query word, with match weights
+# -------------------------------------------------
+def _match_terms(index, word):
+    postings = index["postings"]
+    matches = {}
+
+    if word in postings:
+        matches[word] = EXACT_WEIGHT
+
+    # Prefix matches (e.g. "prog" -> "programming")
+    if index["sorted_dirty"]:
+        index["sorted_terms"] = sorted(postings)
+        index["sorted_dirty"] = False
+    sorted_terms = index["sorted_terms"]
+    position = bisect_left(sorted_terms, word)
+    while (position < len(sorted_terms) and sorted_terms[position].startswith(word)
+           and len(matches) < 4 * MAX_EXPANSIONS):
+        matches.setdefault(sorted_terms[position], PREFIX_WEIGHT)
+        position += 1
+
+    # Trigram candidates, verified by substring or edit distance
+    word_trigrams = _trigrams(word)
+    max_typos = _max_typos(word)
+    min_shared = max(1, len(word_trigrams) - 3 * max(max_typos, 1))
+
+    shared = {}
+    for trigram in word_trigrams:
+        for term in index["trigrams"].get(trigram, ()):
+            shared[term] = shared.get(term, 0) + 1
+
+    for term, count in shared.items():
+        if count < min_shared or term in matches:
+            continue
+        if len(word) >= MIN_SUBSTRING_LENGTH and word in term:
+            matches[term] = SUBSTRING_WEIGHT
+        elif max_typos > 0:
+            distance = edit_distance(word, term, max_typos)
+            if distance <= max_typos:
+                matches[term] = TYPO_WEIGHT * (1 - distance / (len(word) + 1))
+
+    # Keep the best matches, preferring rarer (more selective) terms on ties
+    best = sorted(matches.items(), key=lambda item: (-item[1], len(postings[item[0]])))
+    return best[:MAX_EXPANSIONS]
+
+
+# -------------------------------------------------
+# Ranked search: returns up to top_k (score, record) pairs, best first
+# `stats` (from merge_term_stats) replaces this index's own collection
+# statistics in the BM25 formula
+# -------------------------------------------------
+def search(index, query, top_k=TOP_K, stats=None):
+    sync_index(index)
+
+    words = tuple(sorted(set(tokenize(query))))
+    if all(len(word) < MIN_SUBSTRING_LENGTH for word in words):
+        return _substring_search(index, query, top_k)
+
+    # Same words in any order or case share one cache entry
+    # (with outside statistics, only while the collection size is unchanged)
+    cache = index["cache"]
+    key = (words, top_k) if stats is None else (words, top_k, stats["size"], stats["total_length"])
+    if key in cache["entries"]:
+        cache["hits"] += 1
+        cache["entries"].move_to_end(key)
+        return list(cache["entries"][key])
+
+    cache["misses"] += 1
+    results = _ranked_search(index, words, top_k, stats)
+
+    if cache["max_entries"] > 0:
+        cache["entries"][key] = results
+        if len(cache["entries"]) > cache["max_entries"]:
+            cache["entries"].popitem(last=False)
+            cache["evictions"] += 1
+
+    return list(results)
+
+
+# -------------------------------------------------
+# Collection statistics for a query on this index: record count, total
+# length and the document frequency of every term the query expands to
+# -------------------------------------------------
+def term_stats(index, query):
+    sync_index(index)
+    postings = index["postings"]
+
+    frequencies = {}
+    for word in set(tokenize(query)):
+        for term, _ in _match_terms(index, word):
+            frequencies[term] = len(postings[term])
+
+    return {"size": index["size"], "total_length": index["total_length"], "frequencies": frequencies}
+
+
+# -------------------------------------------------
+# Add up the term_stats() of several indexes (e.g. one per shard)
+# -------------------------------------------------
+def merge_term_stats(partials):
+    merged = {"size": 0, "total_length": 0, "frequencies": {}}
+    for partial in partials:
+        merged["size"] += partial["size"]
+        merged["total_length"] += partial["total_length"]
+        for term, frequency in partial["frequencies"].items():
+            merged["frequencies"][term] = merged["frequencies"].get(term, 0) + frequency
+    return merged
+
+
+# -------------------------------------------------
+# Helper: records whose fields contain `query` as plain text, in list order
+# (not cached: record changes only invalidate cached entries by word)
+# -------------------------------------------------
+def _substring_search(index, query, top_k):
+    needle = str(query).strip().lower()
+    if needle == "":
+        return []
+
+    results = []
+    for record in index["records"]:
+        if any(needle in str(record.get(field, "")).lower() for field in index["fields"]):
+            results.append((0.0, record))
+            if len(results) >= top_k:
+                break
+    return results
+
+
+# -------------------------------------------------
+# Helper: BM25 ranking of the records matching the query words
+# -------------------------------------------------
+def _ranked_search(index, words, top_k, stats=None):
+    if index["size"] == 0:
+        return []
+    size, total_length = (index["size"], index["total_length"]) if stats is None else \
+        (stats["size"], stats["total_length"])
+    average_length = total_length / size
+    frequencies = {} if stats is None else stats["frequencies"]
+    doc_lengths = index["doc_lengths"]
+    postings = index["postings"]
+
+    # One (term, weight) list per query word; rare terms are scored first
+    expansions = []
+    for word in words:
+        for term, weight in _match_terms(index, word):
+            expansions.append((len(postings[term]), word, term, weight))
+    expansions.sort()
+
+    scores = {}        # record position -> total score
+    word_scores = {}   # (record position, query word) -> best score for that word
+
+    for document_frequency, word, term, weight in expansions:
+        document_frequency = frequencies.get(term, document_frequency)
+        idf = math.log(1 + (size - document_frequency + 0.5) / (document_frequency + 0.5))
+        term_postings = postings[term]
+
+        # A very common term only re-scores records already found
+        restrict = len(term_postings) > MAX_SCAN_POSTINGS and len(scores) > 0
+        if len(term_postings) > MAX_SCAN_POSTINGS and not restrict:
+            term_postings = term_postings[:MAX_SCAN_POSTINGS]
+
+        term_frequencies = {}
+        for position in term_postings:
+            if restrict and position not in scores:
+                continue
+            term_frequencies[position] = term_frequencies.get(position, 0) + 1
+
+        for position, tf in term_frequencies.items():
+            length_norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[position] / average_length)
+            score = weight * idf * tf * (BM25_K1 + 1) / (tf + length_norm)
+
+            # Each query word counts once per record (its best matching term)
+            key = (position, word)
+            previous = word_scores.get(key, 0.0)
+            if score > previous:
+                word_scores[key] = score
+                scores[position] = scores.get(position, 0.0) + score - previous
+
+    records = index["records"]
+    best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+    return [(score, records[position]) for position, score in best]
+
+
+# -------------------------------------------------
+# Benchmark: fuzzy search vs the current linear substring scan
+# -------------------------------------------------
+def benchmark_search(n_records=1_000_000, n_queries=50, seed=42):
+    rng = random.Random(seed)
+
+    def make_word():
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+
+    words = [make_word() for _ in range(30_000)]
+    surnames = [make_word().capitalize() for _ in range(20_000)]
+    books = [{"book_id": f"B{i}",
+              "title": " ".join(rng.choice(words) for _ in range(rng.randint(2, 6))).title(),
+              "author": f"{rng.choice(surnames)} {rng.choice(surnames)}",
+              "year": str(rng.randint(1950, 2025)),
+              "available": "yes"}
+             for i in range(n_records)]
+
+    start = time.perf_counter()
+    index = build_index(books, ["title", "author"], cache_size=0)   # measure ranking, not the cache
+    build_seconds = time.perf_counter() - start
+
+    # Queries: one or two real words, half of them with a typo
+    queries = []
+    for i in range(n_queries):
+        picked = rng.sample(books[rng.randrange(n_records)]["title"].lower().split(), 1 + i % 2)
+        if i % 2 == 0:
+            word = picked[0]
+            cut = rng.randrange(len(word))
+            picked[0] = word[:cut] + word[cut + 1:]
+        queries.append(" ".join(picked))
+
+    start = time.perf_counter()
+    for query in queries:
+        keyword = query.lower()
+        [b for b in books if keyword in b["title"].lower() or keyword in b["author"].lower()]
+    scan_ms = (time.perf_counter() - start) / n_queries * 1000
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        search(index, query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    print(f"Records: {n_records}, queries: {n_queries}")
+    print(f"Index build:              {build_seconds:.1f}s")
+    print(f"Linear scan (substring):  {scan_ms:.1f} ms/query")
+    print(f"Fuzzy search (top {TOP_K}):    median {latencies[len(latencies) // 2]:.1f} ms, "
+          f"p95 {latencies[int(len(latencies) * 0.95)]:.1f} ms, max {latencies[-1]:.1f} ms")
+    return build_seconds, scan_ms, latencies
+
+
+if __name__ == "__main__":
+    benchmark_search(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
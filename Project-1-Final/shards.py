@@ -0,0 +1,602 @@
+# ============================================
+# Sharded Multi-Branch Module
+# ============================================
+# Runs several Datasets folders (one per branch, or hash partitions of one
+# library) as shards, each in its own worker process. A coordinator in the
+# calling process:
+#   - routes commands on one ID to the shard that owns it
+#     (add/register/borrow/return and "find" lookups)
+#   - scatter-gathers searches and reports over every shard and merges
+#     the partial results. Searches first gather the term statistics of
+#     every shard, so each shard scores with the global IDF and average
+#     length and the merged ranking matches a single index.
+#
+# Ownership: a book and all of its loans (archived ones included) live on
+# the same shard; members live on their own shard. IDs must be unique
+# across shards: start_cluster() refuses branch folders that share an ID. The coordinator keeps a directory of
+# ID -> shard, filled from the shards at start-up and kept up to date
+# from command results. New IDs are placed by hash (crc32 of the ID).
+#
+# Commands use the batch.py JSON format, plus:
+#   {"op": "find", "book_id": "B1"}   (or "member_id" / "loan_id")
+#   {"op": "report", "name": "counts"}
+#   {"op": "report", "name": "due_soon", "days": 3, "today": "2026-10-18"}
+#   {"op": "report", "name": "books_by_year", "from_year": 2000, "to_year": 2010}
+
+import contextlib
+import csv
+import gzip
+import heapq
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime
+
+import batch
+import book
+import loan
+import member
+import search
+
+ROUTED_OPS = ("add", "register", "borrow", "return", "find")
+SCATTER_OPS = ("search", "report")
+BOOK_FIELDS = ["book_id", "title", "author", "year", "available"]
+MEMBER_FIELDS = ["member_id", "name", "email"]
+
+
+# -------------------------------------------------
+# Helper: hash shard of an ID (stable across runs, unlike hash())
+# -------------------------------------------------
+def shard_of(key, n_shards):
+    return zlib.crc32(str(key).encode("utf-8")) % n_shards
+
+
+# -------------------------------------------------
+# Split one Datasets folder into hash partitions (one folder per shard)
+# Books and loans (and the loan archive) are placed by book_id, members by
+# member_id.
+# -------------------------------------------------
+def split_datasets(source_dir, target_dirs):
+    n_shards = len(target_dirs)
+    tables = [("books.csv", BOOK_FIELDS, "book_id"),
+              ("members.csv", MEMBER_FIELDS, "member_id"),
+              ("loans.csv", loan.LOAN_FIELDS, "book_id")]
+
+    for target_dir in target_dirs:
+        os.makedirs(target_dir, exist_ok=True)
+
+    for file_name, fieldnames, key in tables:
+        source_file = os.path.join(source_dir, file_name)
+        files = [open(os.path.join(target_dir, file_name), "w", newline="", encoding="utf-8")
+                 for target_dir in target_dirs]
+        try:
+            writers = [csv.DictWriter(f, fieldnames=fieldnames) for f in files]
+            for writer in writers:
+                writer.writeheader()
+
+            if os.path.exists(source_file):
+                with open(source_file, "r", newline="", encoding="utf-8") as f:
+                    for row in csv.DictReader(f):
+                        writers[shard_of(row[key], n_shards)].writerow(row)
+        finally:
+            for f in files:
+                f.close()
+
+    _split_archive(source_dir, target_dirs)
+
+
+# -------------------------------------------------
+# Helper: split loans_archive/ (monthly partitions, index and archived IDs)
+# by book_id, keeping the partition file names
+# -------------------------------------------------
+def _split_archive(source_dir, target_dirs):
+    source_archive = os.path.join(source_dir, os.path.basename(loan.ARCHIVE_DIR))
+    source_index = os.path.join(source_archive, os.path.basename(loan.ARCHIVE_INDEX_FILE))
+    if not os.path.exists(source_index):
+        return
+
+    n_shards = len(target_dirs)
+    target_archives = [os.path.join(target_dir, os.path.basename(source_archive)) for target_dir in target_dirs]
+    for target_archive in target_archives:
+        os.makedirs(target_archive, exist_ok=True)
+
+    with open(source_index, "r", newline="", encoding="utf-8") as f:
+        months = list(csv.DictReader(f))
+
+    indexes = [[] for _ in range(n_shards)]
+    archived_ids = [[] for _ in range(n_shards)]
+    for entry in months:
+        with gzip.open(os.path.join(source_archive, entry["file"]), "rt", newline="", encoding="utf-8") as f:
+            rows = [[] for _ in range(n_shards)]
+            for row in csv.DictReader(f):
+                rows[shard_of(row["book_id"], n_shards)].append(row)
+
+        for shard, shard_rows in enumerate(rows):
+            if not shard_rows:
+                continue
+            with gzip.open(os.path.join(target_archives[shard], entry["file"]), "wt", newline="",
+                           encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=loan.LOAN_FIELDS)
+                writer.writeheader()
+                writer.writerows(shard_rows)
+            indexes[shard].append({"month": entry["month"], "file": entry["file"], "rows": len(shard_rows)})
+            archived_ids[shard].extend(row["loan_id"] for row in shard_rows)
+
+    for shard, target_archive in enumerate(target_archives):
+        with open(os.path.join(target_archive, os.path.basename(loan.ARCHIVE_INDEX_FILE)), "w", newline="",
+                  encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=loan.INDEX_FIELDS)
+            writer.writeheader()
+            writer.writerows(indexes[shard])
+        with open(os.path.join(target_archive, os.path.basename(loan.ARCHIVE_IDS_FILE)), "w",
+                  encoding="utf-8") as f:
+            f.writelines(loan_id + "\n" for loan_id in archived_ids[shard])
+
+
+# -------------------------------------------------
+# Shard side: one command against this shard's data
+# -------------------------------------------------
+def _shard_command(state, command):
+    op = command.get("op")
+
+    if op == "find":
+        if "book_id" in command:
+            record = book.find_book(command["book_id"])
+        elif "member_id" in command:
+            record = member.find_member(state["members"], command["member_id"])
+        else:
+            record = loan.find_loan(command.get("loan_id"))
+        return {"ok": record is not None, "op": op, "record": record}
+
+    if op == "search":
+        keyword = book.field_text(command.get("keyword", ""))
+        top_k = int(command.get("top_k", search.TOP_K))
+        return {"ok": True, "op": op,
+                "scored": search.search(_search_index(state, command), keyword, top_k, command.get("stats"))}
+
+    if op == "report":
+        name = command.get("name")
+        if name == "counts":
+            return {"ok": True, "op": op, "counts": {
+                "books": len(book.books),
+                "available_books": sum(1 for b in book.books if b["available"].lower() == "yes"),
+                "members": len(state["members"]),
+                "loans": len(loan.loans),
+                "open_loans": len(loan.loans) - len(loan.find_loans("return_date"))}}
+        if name == "due_soon":
+            today = datetime.strptime(command.get("today") or datetime.today().strftime("%Y-%m-%d"), "%Y-%m-%d")
+            return {"ok": True, "op": op, "rows": loan.find_loans_due_soon(int(command.get("days", 3)), today)}
+        if name == "books_by_year":
+            return {"ok": True, "op": op,
+                    "rows": book.find_books_by_year(command.get("from_year"), command.get("to_year"))}
+        return {"ok": False, "op": op, "error": f"Unknown report '{name}'."}
+
+    return batch.run_command(state, command)
+
+
+# -------------------------------------------------
+# Helper: search index a search command runs on
+# -------------------------------------------------
+def _search_index(state, command):
+    if command.get("type", "books") == "members":
+        return member.get_search_index(state["members"])
+    return book.get_search_index()
+
+
+# -------------------------------------------------
+# Helper: this shard's term statistics for a search (None if the command
+# is invalid: the error is reported when the search itself runs)
+# -------------------------------------------------
+def _shard_term_stats(state, command):
+    try:
+        return search.term_stats(_search_index(state, command), book.field_text(command.get("keyword", "")))
+    except Exception:
+        return None
+
+
+# -------------------------------------------------
+# Helper: run a command on this shard, with the command "id" copied to the result
+# (an error becomes {"ok": false, "error": ...} instead of stopping the worker)
+# -------------------------------------------------
+def _run_on_shard(state, command):
+    # Any error fails this command only: the worker (and its unsaved data) must stay up
+    try:
+        result = _shard_command(state, command)
+    except Exception as error:
+        result = {"ok": False, "op": command.get("op"), "error": f"{type(error).__name__}: {error}"}
+    if "id" in command:
+        result.setdefault("id", command["id"])
+    return _detach(result)
+
+
+# -------------------------------------------------
+# Helper: copy a result so later commands of the same message cannot
+# change the records it holds before it is sent
+# -------------------------------------------------
+def _detach(value):
+    if isinstance(value, dict):
+        return {key: _detach(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_detach(item) for item in value)
+    return value
+
+
+# -------------------------------------------------
+# Shard side: worker process loop
+# Messages: ("run", commands) -> (results, CPU seconds),
+#           ("term_stats", searches) -> (statistics, CPU seconds),
+#           ("ids",) -> owned IDs, ("save",) -> None, ("stop", save) -> None
+# -------------------------------------------------
+def _shard_worker(datasets_dir, conn, quiet):
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull if quiet else sys.stderr):
+        batch.use_datasets_dir(datasets_dir)
+        book.load_books()
+        loan.load_loans()
+        state = {"members": member.load_members(), "check_members": False}
+
+        while True:
+            message = conn.recv()
+            kind = message[0]
+
+            # CPU time (not wall time) of the work, so the benchmark can tell
+            # how long each shard needs even when shards share one CPU
+            if kind == "run":
+                start = time.process_time()
+                results = [_run_on_shard(state, command) for command in message[1]]
+                conn.send((results, time.process_time() - start))
+            elif kind == "term_stats":
+                start = time.process_time()
+                partials = [_shard_term_stats(state, command) for command in message[1]]
+                conn.send((partials, time.process_time() - start))
+            elif kind == "ids":
+                conn.send({"book": [b["book_id"] for b in book.books],
+                           "member": [m["member_id"] for m in state["members"]],
+                           "loan": [l["loan_id"] for l in loan.loans] + list(loan.get_archived_ids())})
+            elif kind == "save":
+                book.save_books()
+                member.save_members(state["members"])
+                loan.save_loans()
+                conn.send(None)
+            elif kind == "stop":
+                if message[1]:
+                    book.save_books()
+                    member.save_members(state["members"])
+                    loan.save_loans()
+                conn.send(None)
+                return
+
+
+# -------------------------------------------------
+# Start one worker process per Datasets folder
+# -------------------------------------------------
+def start_cluster(datasets_dirs, quiet=False):
+    cluster = {
+        "dirs": list(datasets_dirs),
+        "workers": [],                                  # (process, connection) per shard
+        "directory": {"book": {}, "member": {}, "loan": {}},   # ID -> shard
+        "shard_seconds": [0.0] * len(datasets_dirs),    # CPU time spent by each shard
+        "critical_seconds": 0.0,                        # sum over rounds of the slowest shard
+    }
+
+    for datasets_dir in cluster["dirs"]:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_shard_worker, args=(datasets_dir, child_conn, quiet), daemon=True)
+        process.start()
+        cluster["workers"].append((process, parent_conn))
+
+    # Build the ID directory (asked from every shard at once)
+    for _, conn in cluster["workers"]:
+        conn.send(("ids",))
+    duplicates = []
+    for shard, (_, conn) in enumerate(cluster["workers"]):
+        for kind, ids in conn.recv().items():
+            for key in ids:
+                owner = cluster["directory"][kind].setdefault(key, shard)
+                if owner != shard:
+                    duplicates.append(f"{kind} '{key}' ({cluster['dirs'][owner]}, {cluster['dirs'][shard]})")
+
+    # A shared ID could only ever be routed to one of its shards
+    if duplicates:
+        stop_cluster(cluster, save=False)
+        raise ValueError(f"{len(duplicates)} ID(s) exist in more than one shard, e.g. {'; '.join(duplicates[:3])}. "
+                         f"Rename them so every ID is unique across the branches.")
+
+    return cluster
+
+
+# -------------------------------------------------
+# Save every shard to its Datasets folder
+# -------------------------------------------------
+def save_cluster(cluster):
+    for _, conn in cluster["workers"]:
+        conn.send(("save",))
+    for _, conn in cluster["workers"]:
+        conn.recv()
+
+
+# -------------------------------------------------
+# Stop the workers (saving first unless save=False)
+# -------------------------------------------------
+def stop_cluster(cluster, save=True):
+    for _, conn in cluster["workers"]:
+        conn.send(("stop", save))
+    for process, conn in cluster["workers"]:
+        conn.recv()
+        process.join()
+    cluster["workers"] = []
+
+
+# -------------------------------------------------
+# Helper: send one message to some shards and collect their replies
+# (shards work in parallel; CPU time is added to the cluster counters)
+# -------------------------------------------------
+def _exchange(cluster, messages):
+    for shard, message in messages.items():
+        cluster["workers"][shard][1].send(message)
+
+    replies = {}
+    slowest = 0.0
+    for shard in messages:
+        replies[shard], seconds = cluster["workers"][shard][1].recv()
+        cluster["shard_seconds"][shard] += seconds
+        slowest = max(slowest, seconds)
+    cluster["critical_seconds"] += slowest
+    return replies
+
+
+# -------------------------------------------------
+# Helper: merge the partial results of a scattered command
+# -------------------------------------------------
+def _merge(command, partials):
+    failed = [partial for partial in partials if not partial["ok"]]
+    if failed:
+        return failed[0]
+
+    result = {"ok": True, "op": command["op"]}
+    if "id" in command:
+        result["id"] = command["id"]
+    if command["op"] == "search":
+        # Shards scored with the same global statistics, so scores compare
+        top_k = int(command.get("top_k", search.TOP_K))
+        scored = heapq.nlargest(top_k, (pair for partial in partials for pair in partial["scored"]),
+                                key=lambda pair: pair[0])
+        result["results"] = [record for _, record in scored]
+    elif "counts" in partials[0]:
+        result["counts"] = {name: sum(partial["counts"][name] for partial in partials)
+                            for name in partials[0]["counts"]}
+    else:
+        sort_field = "year" if command.get("name") == "books_by_year" else "due_date"
+        rows = [row for partial in partials for row in partial["rows"]]
+        result["rows"] = sorted(rows, key=lambda row: int(row[sort_field]) if sort_field == "year" else row[sort_field])
+    return result
+
+
+# -------------------------------------------------
+# Helper: shard that should run a routed command, or an error message
+# `pending` holds IDs created by earlier commands of the same round
+# -------------------------------------------------
+def _route(cluster, command, pending):
+    directory = cluster["directory"]
+    n_shards = len(cluster["workers"])
+    op = command.get("op")
+
+    def owner(kind, key):
+        key = book.field_text(key)
+        return pending[kind].get(key, directory[kind].get(key))
+
+    if op == "add":
+        shard = owner("book", command.get("book_id", ""))
+        return shard if shard is not None else shard_of(book.field_text(command.get("book_id", "")), n_shards), None
+    if op == "register":
+        shard = owner("member", command.get("member_id", ""))
+        return shard if shard is not None else shard_of(book.field_text(command.get("member_id", "")), n_shards), None
+    if op == "borrow":
+        if owner("loan", command.get("loan_id", "")) is not None:
+            return None, "This Loan ID already exists."
+        if owner("member", command.get("member_id", "")) is None:
+            return None, f"Member ID '{command.get('member_id', '')}' does not exist."
+        shard = owner("book", command.get("book_id", ""))
+        if shard is None:
+            return None, f"Book ID '{command.get('book_id', '')}' does not exist."
+        return shard, None
+    if op == "return":
+        shard = owner("loan", command.get("loan_id", ""))
+        if shard is None:
+            return None, f"Loan ID '{command.get('loan_id', '')}' not found."
+        return shard, None
+
+    # find
+    for kind in ("book", "member", "loan"):
+        if f"{kind}_id" in command:
+            shard = owner(kind, command[f"{kind}_id"])
+            return (shard, None) if shard is not None else (None, f"{kind.capitalize()} ID not found.")
+    return None, "find needs a book_id, member_id or loan_id."
+
+
+# -------------------------------------------------
+# Run a list of commands on the cluster; results come back in input order
+# Each shard gets its commands in one message, and shards run them in
+# parallel. A borrow by a member registered earlier in the same list
+# waits until that registration has run (it may have failed).
+# -------------------------------------------------
+def execute(cluster, commands):
+    n_shards = len(cluster["workers"])
+    results = [None] * len(commands)
+    queues = [[] for _ in range(n_shards)]   # per shard: (position, command)
+    scattered = {}                          # position -> partial results
+    pending = {"book": {}, "member": {}, "loan": {}}
+    created = []                            # (position, kind, key, shard) to confirm after the round
+
+    def run_round():
+        # Searches: add up every shard's term statistics first
+        searches = [position for position in scattered if commands[position]["op"] == "search"]
+        global_stats = {}
+        if searches:
+            replies = _exchange(cluster, {shard: ("term_stats", [commands[position] for position in searches])
+                                          for shard in range(n_shards)})
+            for i, position in enumerate(searches):
+                partials = [replies[shard][i] for shard in range(n_shards)]
+                if None not in partials:
+                    global_stats[position] = search.merge_term_stats(partials)
+
+        replies = _exchange(cluster, {shard: ("run", [dict(command, stats=global_stats[position])
+                                                      if position in global_stats else command
+                                                      for position, command in queues[shard]])
+                                      for shard in range(n_shards) if queues[shard]})
+        for shard, shard_results in replies.items():
+            for (position, _), result in zip(queues[shard], shard_results):
+                if position in scattered:
+                    scattered[position].append(result)
+                else:
+                    results[position] = dict(result, shard=shard)
+            queues[shard].clear()
+
+        for position, partials in scattered.items():
+            results[position] = _merge(commands[position], partials)
+        scattered.clear()
+
+        for position, kind, key, shard in created:
+            if results[position]["ok"]:
+                cluster["directory"][kind][key] = shard
+        created.clear()
+        for kind in pending:
+            pending[kind].clear()
+
+    for position, command in enumerate(commands):
+        op = command.get("op")
+
+        if not isinstance(op, str) or op not in SCATTER_OPS + ROUTED_OPS:
+            results[position] = {"ok": False, "op": op if isinstance(op, str) else None,
+                                 "error": f"Unknown op {op!r}. Use one of: {', '.join(ROUTED_OPS + SCATTER_OPS)}."}
+            if "id" in command:
+                results[position]["id"] = command["id"]
+            continue
+
+        if op in SCATTER_OPS:
+            scattered[position] = []
+            for queue in queues:
+                queue.append((position, command))
+            continue
+
+        if op == "borrow" and book.field_text(command.get("member_id", "")) in pending["member"]:
+            run_round()
+
+        shard, error = _route(cluster, command, pending)
+        if error is not None:
+            results[position] = {"ok": False, "op": op, "error": error}
+            if "id" in command:
+                results[position]["id"] = command["id"]
+            continue
+
+        queues[shard].append((position, command))
+        new_id = {"add": ("book", "book_id"), "register": ("member", "member_id"),
+                  "borrow": ("loan", "loan_id")}.get(op)
+        if new_id is not None:
+            key = book.field_text(command.get(new_id[1], ""))
+            pending[new_id[0]].setdefault(key, shard)
+            created.append((position, new_id[0], key, shard))
+
+    run_round()
+    return results
+
+
+# -------------------------------------------------
+# Benchmark: commands/sec with 1, 2, 4 ... shards on one machine
+# Besides wall-clock throughput (which cannot scale past the number of
+# CPUs), it reports the CPU time of each shard and the CPU-bound throughput
+# with one CPU per shard: coordinator CPU time plus, for every round, the
+# CPU time of the slowest shard (time waiting on pipes is not included).
+# -------------------------------------------------
+def benchmark_shards(shard_counts=(1, 2, 4), n_books=100_000, n_members=50_000, n_loans=200_000,
+                     n_commands=20_000, batch_size=1_000, search_share=0.15, seed=42):
+    rng = random.Random(seed)
+
+    # Workload: finds, borrows and returns (routed to one shard) in a 40:25:20
+    # ratio, plus `search_share` searches (sent to every shard)
+    routed_share = 1 - search_share
+    commands = []
+    next_loan = 0
+    returnable = [f"L{i}" for i in range(n_loans) if i % 3 == 0]   # open loans in the data set
+    for i in range(n_commands):
+        roll = rng.random()
+        if roll >= routed_share:
+            commands.append({"op": "search", "type": "books", "keyword": f"{rng.randrange(n_books)}"})
+        elif roll < routed_share * 40 / 85:
+            commands.append({"op": "find", "book_id": f"B{rng.randrange(n_books)}"})
+        elif roll < routed_share * 65 / 85:
+            commands.append({"op": "borrow", "loan_id": f"N{next_loan}", "book_id": f"B{rng.randrange(n_books)}",
+                             "member_id": f"M{rng.randrange(n_members)}",
+                             "borrow_date": "2026-10-01", "due_date": "2026-10-15"})
+            next_loan += 1
+        elif returnable:
+            commands.append({"op": "return", "loan_id": returnable.pop(rng.randrange(len(returnable))),
+                             "return_date": "2026-10-17"})
+        else:
+            commands.append({"op": "find", "loan_id": f"L{rng.randrange(n_loans)}"})
+
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_dir = os.path.join(temp_dir, "source")
+        os.makedirs(source_dir)
+        with open(os.path.join(source_dir, "books.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(BOOK_FIELDS)
+            writer.writerows((f"B{i}", f"Book Title {i}", f"Author {i % 5000}", 1950 + i % 75,
+                              "no" if i < n_loans and i % 3 == 0 else "yes") for i in range(n_books))
+        with open(os.path.join(source_dir, "members.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(MEMBER_FIELDS)
+            writer.writerows((f"M{i}", f"Member Name {i}", f"member{i}@student.usm.my") for i in range(n_members))
+        with open(os.path.join(source_dir, "loans.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(loan.LOAN_FIELDS)
+            writer.writerows((f"L{i}", f"B{i % n_books}", f"M{i % n_members}", "2026-09-20", "2026-10-04",
+                              "" if i % 3 == 0 else "2026-10-01", "0") for i in range(n_loans))
+
+        for n_shards in shard_counts:
+            shard_dirs = [os.path.join(temp_dir, f"{n_shards}-shards", f"shard{i}") for i in range(n_shards)]
+            split_datasets(source_dir, shard_dirs)
+            cluster = start_cluster(shard_dirs, quiet=True)
+            try:
+                execute(cluster, [{"op": "search", "keyword": "warm up"}])   # builds the search indexes
+                cluster["shard_seconds"] = [0.0] * n_shards
+                cluster["critical_seconds"] = 0.0
+
+                start = time.perf_counter()
+                start_cpu = time.process_time()
+                ok = 0
+                for first in range(0, n_commands, batch_size):
+                    ok += sum(result["ok"] for result in execute(cluster, commands[first:first + batch_size]))
+                seconds = time.perf_counter() - start
+                coordinator_seconds = time.process_time() - start_cpu
+                shard_seconds = cluster["shard_seconds"]
+                parallel_seconds = coordinator_seconds + cluster["critical_seconds"]
+            finally:
+                stop_cluster(cluster, save=False)
+
+            results.append({"shards": n_shards, "ok": ok, "seconds": seconds,
+                            "coordinator_seconds": coordinator_seconds, "shard_seconds": shard_seconds,
+                            "parallel_seconds": parallel_seconds})
+            print(f"{n_shards} shard(s): {n_commands / seconds:>7.0f} commands/sec wall clock, "
+                  f"{n_commands / parallel_seconds:>7.0f} CPU-bound with one CPU per shard "
+                  f"({ok} ok of {n_commands}; CPU s: coordinator {coordinator_seconds:.2f}, "
+                  f"shards {' / '.join(f'{t:.2f}' for t in shard_seconds)})")
+
+    cpus = os.cpu_count() or 1
+    print(f"CPUs on this machine: {cpus}")
+    if cpus < max(shard_counts):
+        print("Fewer CPUs than shards: the shards take turns on the CPU, so wall-clock throughput "
+              "cannot grow; compare the CPU-bound column, computed from measured CPU times.")
+    return results
+
+
+if __name__ == "__main__":
+    # python shards.py [--routed] [shard counts...]   (--routed: no searches)
+    arguments = sys.argv[1:]
+    search_share = 0.0 if "--routed" in arguments else 0.15
+    benchmark_shards(tuple(int(n) for n in arguments if n != "--routed") or (1, 2, 4), search_share=search_share)
@@ -0,0 +1,199 @@
+# ============================================
+# Read Snapshot Module
+# ============================================
+# Point-in-time views of the in-memory tables (book.books, loan.loans) for
+# long reports, while desks keep borrowing and returning.
+#
+#   - Taking a snapshot is O(1): it remembers the list, its length and the
+#     table version. Rows appended later are past that length; rows
+#     removed later (archiving) leave the old list object untouched,
+#     because writers swap in a new list instead of shrinking it.
+#   - Rows changed in place after the snapshot are read back through an
+#     undo log: before a field is overwritten, its old value is logged
+#     with the new version number. Unchanged rows are shared with the live
+#     table, so writers never copy the table.
+#   - The undo log is only written while a snapshot is open, and is
+#     trimmed when snapshots are released.
+
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+_tables = {}   # table name -> {"version", "open", "undo"}
+
+
+# -------------------------------------------------
+# Helper: versioning state of a table (created on first use)
+# -------------------------------------------------
+def _table(name):
+    if name not in _tables:
+        _tables[name] = {
+            "version": 0,   # bumped on every write
+            "open": {},     # snapshot version -> number of open snapshots at that version
+            "undo": {},     # id(record) -> (record, [(version, field, old value), ...])
+        }
+    return _tables[name]
+
+
+# -------------------------------------------------
+# Set record[field] = value, keeping the old value for open snapshots
+# -------------------------------------------------
+def write(name, record, field, value):
+    with _lock:
+        table = _table(name)
+        table["version"] += 1
+
+        if table["open"]:
+            entry = table["undo"].setdefault(id(record), (record, []))
+            entry[1].append((table["version"], field, record.get(field)))
+
+        record[field] = value
+
+
+# -------------------------------------------------
+# Take a snapshot of `records` (the live list of table `name`) in O(1)
+# -------------------------------------------------
+def take(name, records):
+    with _lock:
+        table = _table(name)
+        version = table["version"]
+        table["open"][version] = table["open"].get(version, 0) + 1
+
+    return {"table": name, "records": records, "length": len(records), "version": version, "open": True}
+
+
+# -------------------------------------------------
+# Release a snapshot (undo entries no open snapshot needs are dropped)
+# -------------------------------------------------
+def release(snap):
+    if not snap["open"]:
+        return
+
+    with _lock:
+        snap["open"] = False
+        table = _table(snap["table"])
+        open_versions = table["open"]
+
+        open_versions[snap["version"]] -= 1
+        if open_versions[snap["version"]] == 0:
+            del open_versions[snap["version"]]
+
+        if not open_versions:
+            table["undo"].clear()
+            return
+
+        # A snapshot only needs entries written after it was taken
+        oldest = min(open_versions)
+        for key in list(table["undo"]):
+            record, entries = table["undo"][key]
+            entries[:] = [entry for entry in entries if entry[0] > oldest]
+            if not entries:
+                del table["undo"][key]
+
+
+# -------------------------------------------------
+# Snapshot as a context manager: released when the block ends
+# -------------------------------------------------
+@contextmanager
+def open_snapshot(name, records):
+    snap = take(name, records)
+    try:
+        yield snap
+    finally:
+        release(snap)
+
+
+# -------------------------------------------------
+# Helper: a record as it was at snapshot version `version`
+# -------------------------------------------------
+def _as_of(undo, record, version):
+    row = dict(record)   # copied first: a write after this is still found in the log
+
+    entry = undo.get(id(record))
+    if entry is not None:
+        restored = set()
+        for entry_version, field, old_value in list(entry[1]):
+            # The first change after the snapshot holds the value it saw
+            if entry_version > version and field not in restored:
+                row[field] = old_value
+                restored.add(field)
+
+    return row
+
+
+# -------------------------------------------------
+# Rows of a snapshot, one dict per record, as they were when it was taken
+# -------------------------------------------------
+def rows(snap):
+    if not snap["open"]:
+        raise ValueError("This snapshot has been released.")
+
+    undo = _table(snap["table"])["undo"]
+    records, version = snap["records"], snap["version"]
+    for position in range(snap["length"]):
+        yield _as_of(undo, records[position], version)
+
+
+# -------------------------------------------------
+# Counters for one table (to check the undo log stays small)
+# -------------------------------------------------
+def stats(name):
+    table = _table(name)
+    return {
+        "version": table["version"],
+        "open_snapshots": sum(table["open"].values()),
+        "undo_records": len(table["undo"]),
+        "undo_entries": sum(len(entries) for _, entries in table["undo"].values()),
+    }
+
+
+# -------------------------------------------------
+# Benchmark: snapshot vs full copy, and the cost of writes while a report runs
+# -------------------------------------------------
+def benchmark_snapshots(n_rows=1_000_000, n_writes=100_000, seed=42):
+    rng = random.Random(seed)
+    table = [{"loan_id": f"L{i}", "return_date": "", "fine": "0"} for i in range(n_rows)]
+
+    start = time.perf_counter()
+    [dict(record) for record in table]
+    copy_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    snap = take("benchmark", table)
+    snapshot_ms = (time.perf_counter() - start) * 1000
+
+    positions = [rng.randrange(n_rows) for _ in range(n_writes)]
+
+    start = time.perf_counter()
+    for position in positions:
+        write("benchmark", table[position], "return_date", "2026-10-18")
+    write_us = (time.perf_counter() - start) / n_writes * 1e6
+
+    start = time.perf_counter()
+    returned = sum(1 for row in rows(snap) if row["return_date"] != "")
+    read_seconds = time.perf_counter() - start
+
+    if returned != 0:
+        raise RuntimeError("The snapshot saw writes made after it was taken.")
+    release(snap)
+
+    start = time.perf_counter()
+    for position in positions:
+        write("benchmark", table[position], "return_date", "2026-10-19")
+    plain_write_us = (time.perf_counter() - start) / n_writes * 1e6
+    del _tables["benchmark"]
+
+    print(f"Rows: {n_rows}, writes: {n_writes}")
+    print(f"Full copy of the table:        {copy_ms:.1f} ms")
+    print(f"take():                        {snapshot_ms:.3f} ms")
+    print(f"write() with a snapshot open:  {write_us:.2f} us")
+    print(f"write() with none open:        {plain_write_us:.2f} us")
+    print(f"Reading the whole snapshot:    {read_seconds:.2f}s")
+    return copy_ms, snapshot_ms, write_us, plain_write_us, read_seconds
+
+
+if __name__ == "__main__":
+    benchmark_snapshots(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -5,34 +5,30 @@
 import csv
 import os
 import sys
-import ipynbname
-
-# Check if DATASETS_DIR is set by main script (via environment variable)
-if 'LMS_DATASETS_DIR' in os.environ:
-    # Running from main script - use the pre-set directory
-    DATASETS_DIR = os.environ['LMS_DATASETS_DIR']
-    print("Using Datasets directory from main script")
-else:
-    # Running standalone - calculate the directory
-    notebook_path = ipynbname.path()
-    print("Current path: ", notebook_path.parent)
-    sys.path.insert(0, notebook_path.parent.as_posix())
-
-    # Find Project-1 directory by walking up the path
-    def find_project_dir(path):
-        current = path.parent
-        while current.name != "":
-            if current.name == "Project-1":
-                return str(current)
-            current = current.parent
-        return str(path.parent.parent) if "Management" in str(path.parent) else str(path.parent)
-
-    PROJECT_DIR = find_project_dir(notebook_path)
-    DATASETS_DIR = os.path.join(PROJECT_DIR, "Datasets")
-    os.makedirs(DATASETS_DIR, exist_ok=True)
-
-BOOKS_FILE = os.path.join(DATASETS_DIR, "books.csv")
-print(f"Books will be saved to: {BOOKS_FILE}")
+
+# Shared configuration lives one folder up (Project-1-Teamwork/lms_config.py)
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_DIR not in sys.path:
+    sys.path.insert(0, _PROJECT_DIR)
+
+import lms_config
+
+
+# -------------------------------------------------
+# Books file path (resolved on first use, not at import)
+# -------------------------------------------------
+def get_books_file():
+    return lms_config.dataset_file("books.csv")
+
+
+# BOOKS_FILE and DATASETS_DIR stay available as module attributes
+def __getattr__(name):
+    if name == "BOOKS_FILE":
+        return get_books_file()
+    if name == "DATASETS_DIR":
+        return lms_config.get_datasets_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 books = []   # global list to store book records
 
 # -------------------------------------------------
@@ -41,17 +37,18 @@ books = []   # global list to store book records
 def load_books():
     global books
     books = []
+    books_file = get_books_file()
 
-    if not os.path.exists(BOOKS_FILE):
-        print(f"File '{BOOKS_FILE}' not found. Starting with empty list.")
+    if not os.path.exists(books_file):
+        print(f"File '{books_file}' not found. Starting with empty list.")
         return
 
-    with open(BOOKS_FILE, mode="r", newline="", encoding="utf-8") as f:
+    with open(books_file, mode="r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             books.append(row)
 
-    print(f"Loaded {len(books)} book(s) from '{BOOKS_FILE}'.")
+    print(f"Loaded {len(books)} book(s) from '{books_file}'.")
 
 
 # -------------------------------------------------
@@ -59,14 +56,16 @@ def load_books():
 # -------------------------------------------------
 def save_books():
     fieldnames = ["book_id", "title", "author", "year", "available"]
+    books_file = get_books_file()
+    lms_config.ensure_datasets_dir()
 
-    with open(BOOKS_FILE, mode="w", newline="", encoding="utf-8") as f:
+    with open(books_file, mode="w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for book in books:
             writer.writerow(book)
 
-    print(f"Saved {len(books)} book(s) to '{BOOKS_FILE}'.")
+    print(f"Saved {len(books)} book(s) to '{books_file}'.")
 
 
 # -------------------------------------------------
@@ -5,35 +5,31 @@
 import csv
 import os
 import sys
-import ipynbname
 from datetime import datetime
 
-# Check if DATASETS_DIR is set by main script (via environment variable)
-if 'LMS_DATASETS_DIR' in os.environ:
-    # Running from main script - use the pre-set directory
-    DATASETS_DIR = os.environ['LMS_DATASETS_DIR']
-    print("Using Datasets directory from main script")
-else:
-    # Running standalone - calculate the directory
-    notebook_path = ipynbname.path()
-    print("Current path: ", notebook_path.parent)
-    sys.path.insert(0, notebook_path.parent.as_posix())
-
-    # Find Project-1 directory by walking up the path
-    def find_project_dir(path):
-        current = path.parent
-        while current.name != "":
-            if current.name == "Project-1":
-                return str(current)
-            current = current.parent
-        return str(path.parent.parent) if "Management" in str(path.parent) else str(path.parent)
-
-    PROJECT_DIR = find_project_dir(notebook_path)
-    DATASETS_DIR = os.path.join(PROJECT_DIR, "Datasets")
-    os.makedirs(DATASETS_DIR, exist_ok=True)
-
-LOANS_FILE = os.path.join(DATASETS_DIR, "loans.csv")
-print(f"Loans will be saved to: {LOANS_FILE}")
+# Shared configuration lives one folder up (Project-1-Teamwork/lms_config.py)
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_DIR not in sys.path:
+    sys.path.insert(0, _PROJECT_DIR)
+
+import lms_config
+
+
+# -------------------------------------------------
+# Loans file path (resolved on first use, not at import)
+# -------------------------------------------------
+def get_loans_file():
+    return lms_config.dataset_file("loans.csv")
+
+
+# LOANS_FILE and DATASETS_DIR stay available as module attributes
+def __getattr__(name):
+    if name == "LOANS_FILE":
+        return get_loans_file()
+    if name == "DATASETS_DIR":
+        return lms_config.get_datasets_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 loans = []   # global list to store loan records
 
 # -------------------------------------------------
@@ -42,17 +38,18 @@ loans = []   # global list to store loan records
 def load_loans():
     global loans
     loans = []
+    loans_file = get_loans_file()
 
-    if not os.path.exists(LOANS_FILE):
-        print(f"File '{LOANS_FILE}' not found. Starting with empty list.")
+    if not os.path.exists(loans_file):
+        print(f"File '{loans_file}' not found. Starting with empty list.")
         return
 
-    with open(LOANS_FILE, mode="r", newline="", encoding="utf-8") as f:
+    with open(loans_file, mode="r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             loans.append(row)
 
-    print(f"Loaded {len(loans)} loan(s) from '{LOANS_FILE}'.")
+    print(f"Loaded {len(loans)} loan(s) from '{loans_file}'.")
 
 
 # -------------------------------------------------
@@ -60,14 +57,16 @@ def load_loans():
 # -------------------------------------------------
 def save_loans():
     fieldnames = ["loan_id", "book_id", "member_id", "borrow_date", "due_date", "return_date", "fine"]
+    loans_file = get_loans_file()
+    lms_config.ensure_datasets_dir()
 
-    with open(LOANS_FILE, mode="w", newline="", encoding="utf-8") as f:
+    with open(loans_file, mode="w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for loan in loans:
             writer.writerow(loan)
 
-    print(f"Saved {len(loans)} loan(s) to '{LOANS_FILE}'.")
+    print(f"Saved {len(loans)} loan(s) to '{loans_file}'.")
 
 
 # -------------------------------------------------
@@ -2,41 +2,39 @@ import csv
 import os
 import re
 import sys
-import ipynbname
-
-# Check if DATASETS_DIR is set by main script (via environment variable)
-if 'LMS_DATASETS_DIR' in os.environ:
-    # Running from main script - use the pre-set directory
-    DATASETS_DIR = os.environ['LMS_DATASETS_DIR']
-    print("Using Datasets directory from main script")
-else:
-    # Running standalone - calculate the directory
-    notebook_path = ipynbname.path()
-    print("Current path: ", notebook_path.parent)
-    sys.path.insert(0, notebook_path.parent.as_posix())
-
-    # Find Project-1 directory by walking up the path
-    def find_project_dir(path):
-        current = path.parent
-        while current.name != "":
-            if current.name == "Project-1":
-                return str(current)
-            current = current.parent
-        return str(path.parent.parent) if "Management" in str(path.parent) else str(path.parent)
-
-    PROJECT_DIR = find_project_dir(notebook_path)
-    DATASETS_DIR = os.path.join(PROJECT_DIR, "Datasets")
-    os.makedirs(DATASETS_DIR, exist_ok=True)
-
-MEMBERS_FILE = os.path.join(DATASETS_DIR, "members.csv")
-print(f"Members will be saved to: {MEMBERS_FILE}")
+
+# Shared configuration lives one folder up (Project-1-Teamwork/lms_config.py)
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_DIR not in sys.path:
+    sys.path.insert(0, _PROJECT_DIR)
+
+import lms_config
+
+
+# -------------------------------------------------
+# Members file path (resolved on first use, not at import)
+# -------------------------------------------------
+def get_members_file():
+    return lms_config.dataset_file("members.csv")
+
+
+# MEMBERS_FILE and DATASETS_DIR stay available as module attributes
+def __getattr__(name):
+    if name == "MEMBERS_FILE":
+        return get_members_file()
+    if name == "DATASETS_DIR":
+        return lms_config.get_datasets_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # -------------------------------
 # Creating File
 # -------------------------------
 def initialize_members_file():
-    if not os.path.exists(MEMBERS_FILE):
-        with open(MEMBERS_FILE, "w", newline="", encoding="utf-8") as file:
+    members_file = get_members_file()
+    if not os.path.exists(members_file):
+        lms_config.ensure_datasets_dir()
+        with open(members_file, "w", newline="", encoding="utf-8") as file:
             writer = csv.writer(file)
             writer.writerow(["member_id", "name", "email"])   # header row
 
@@ -48,7 +46,7 @@ def load_members():
     initialize_members_file()
     members = []
 
-    with open(MEMBERS_FILE, "r", newline="", encoding="utf-8") as file:
+    with open(get_members_file(), "r", newline="", encoding="utf-8") as file:
         reader = csv.DictReader(file)
         for row in reader:
             members.append(row)
@@ -60,7 +58,8 @@ def load_members():
 # SAVE DATAFRAME → members.csv
 # -------------------------------------
 def save_members(data):
-    with open(MEMBERS_FILE, "w", newline="", encoding="utf-8") as file:
+    lms_config.ensure_datasets_dir()
+    with open(get_members_file(), "w", newline="", encoding="utf-8") as file:
         fieldnames = ["member_id", "name", "email"]
         writer = csv.DictWriter(file, fieldnames=fieldnames)
 
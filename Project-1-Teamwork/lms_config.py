@@ -0,0 +1,54 @@
+# ============================================
+# Shared Configuration Module
+# ============================================
+# Resolves the Datasets directory used by the book, loan and member
+# modules. The directory is worked out once, on first use, and cached:
+#   1. LMS_DATASETS_DIR environment variable (set by main.ipynb), or
+#   2. the "Datasets" folder next to this file (Project-1-Teamwork/Datasets)
+# Nothing is created on disk until a module actually saves a file.
+
+import os
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_datasets_dir = None   # cached result of get_datasets_dir()
+_dir_created = False
+
+
+# -------------------------------------------------
+# Get the Datasets directory (resolved once)
+# -------------------------------------------------
+def get_datasets_dir():
+    global _datasets_dir
+
+    if _datasets_dir is None:
+        _datasets_dir = os.environ.get("LMS_DATASETS_DIR") or os.path.join(PROJECT_DIR, "Datasets")
+
+    return _datasets_dir
+
+
+# -------------------------------------------------
+# Full path of a file inside the Datasets directory
+# -------------------------------------------------
+def dataset_file(filename):
+    return os.path.join(get_datasets_dir(), filename)
+
+
+# -------------------------------------------------
+# Create the Datasets directory (only before the first write)
+# -------------------------------------------------
+def ensure_datasets_dir():
+    global _dir_created
+
+    if not _dir_created:
+        os.makedirs(get_datasets_dir(), exist_ok=True)
+        _dir_created = True
+
+
+# -------------------------------------------------
+# Forget the cached directory (e.g. after changing LMS_DATASETS_DIR)
+# -------------------------------------------------
+def reset():
+    global _datasets_dir, _dir_created
+    _datasets_dir = None
+    _dir_created = False
@@ -0,0 +1,182 @@
+# ============================================
+# Heart Disease Dataset Loader Module
+# ============================================
+# Loads heart_disease.csv with an explicit, compact schema:
+#   - small integer / float32 columns instead of int64 / float64
+#   - categorical dtypes for the coded features (cp, thal, slope, ...)
+#   - UTF-8 BOM on the header is removed
+#   - every value is checked against its allowed range or categories
+# The typed result can be cached as .npz (or Parquet when pyarrow is
+# installed) next to the CSV for instant reloads.
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASET_FILE = os.path.join(SCRIPT_DIR, "..", "Datasets", "heart_disease.csv")
+
+SCHEMA_VERSION = 1    # bump when SCHEMA changes to invalidate old cache files
+CHUNK_SIZE = 250_000  # rows parsed (and validated) at a time
+
+# Storage dtype and allowed values of every column
+SCHEMA = {
+    'age':      {'dtype': 'int8',    'range': (0, 120)},
+    'sex':      {'dtype': 'int8',    'categories': [0, 1]},
+    'cp':       {'dtype': 'int8',    'categories': [0, 1, 2, 3]},
+    'trestbps': {'dtype': 'int16',   'range': (0, 300)},
+    'chol':     {'dtype': 'int16',   'range': (0, 1000)},
+    'fbs':      {'dtype': 'int8',    'categories': [0, 1]},
+    'restecg':  {'dtype': 'int8',    'categories': [0, 1, 2]},
+    'thalach':  {'dtype': 'int16',   'range': (0, 300)},
+    'exang':    {'dtype': 'int8',    'categories': [0, 1]},
+    'oldpeak':  {'dtype': 'float32', 'range': (-10.0, 10.0)},
+    'slope':    {'dtype': 'int8',    'categories': [0, 1, 2]},
+    'ca':       {'dtype': 'int8',    'categories': [0, 1, 2, 3, 4]},
+    'thal':     {'dtype': 'int8',    'categories': [0, 1, 2, 3]},
+    'target':   {'dtype': 'int8',    'categories': [0, 1]},
+}
+
+
+# -------------------------------------------------
+# Helper: dtype used while parsing (wide enough to catch out-of-range values)
+# -------------------------------------------------
+def _parse_dtypes():
+    return {col: 'float64' if spec['dtype'].startswith('float') else 'int32'
+            for col, spec in SCHEMA.items()}
+
+
+# -------------------------------------------------
+# Helper: check one chunk against the schema, then downcast it
+# -------------------------------------------------
+def _validate_and_downcast(chunk):
+    missing = [col for col in SCHEMA if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    for col, spec in SCHEMA.items():
+        values = chunk[col]
+        if 'categories' in spec:
+            invalid = ~values.isin(spec['categories'])
+            allowed = spec['categories']
+        else:
+            low, high = spec['range']
+            invalid = (values < low) | (values > high)
+            allowed = f"[{low}, {high}]"
+
+        if invalid.any():
+            examples = sorted(values[invalid].unique().tolist())[:5]
+            raise ValueError(f"Column '{col}' has {int(invalid.sum())} value(s) outside {allowed}, "
+                             f"e.g. {examples}.")
+
+    return chunk.astype({col: spec['dtype'] for col, spec in SCHEMA.items()})
+
+
+# -------------------------------------------------
+# Helper: turn coded columns into categorical dtypes
+# -------------------------------------------------
+def _to_categorical(data):
+    for col, spec in SCHEMA.items():
+        if 'categories' in spec:
+            data[col] = data[col].astype(pd.CategoricalDtype(spec['categories']))
+    return data
+
+
+# -------------------------------------------------
+# Helper: cache file path for a CSV (changes when the CSV changes)
+# -------------------------------------------------
+def cache_path(path, cache_format="npz"):
+    info = os.stat(path)
+    key = hashlib.sha1(f"{info.st_size}:{info.st_mtime_ns}:{SCHEMA_VERSION}".encode("utf-8")).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(path)), ".cache", f"{name}.{key}.{cache_format}")
+
+
+# -------------------------------------------------
+# Helper: write / read the typed (non-categorical) table
+# -------------------------------------------------
+def _write_cache(data, path, cache_format):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+
+    if cache_format == "parquet":
+        data.to_parquet(temp_path, index=False)
+    else:
+        with open(temp_path, "wb") as f:
+            np.savez(f, **{col: data[col].to_numpy() for col in data.columns})
+
+    os.replace(temp_path, path)
+
+
+def _read_cache(path, cache_format):
+    if cache_format == "parquet":
+        return pd.read_parquet(path)
+
+    with np.load(path) as arrays:
+        return pd.DataFrame({col: arrays[col] for col in SCHEMA})
+
+
+# -------------------------------------------------
+# Load heart_disease.csv with the compact schema
+# -------------------------------------------------
+def load_heart_disease(path=DATASET_FILE, categorical=True, cache=False, cache_format="npz"):
+    if cache_format not in ("npz", "parquet"):
+        raise ValueError("cache_format must be 'npz' or 'parquet'.")
+
+    cached_file = cache_path(path, cache_format) if cache else None
+
+    if cached_file and os.path.exists(cached_file):
+        data = _read_cache(cached_file, cache_format)
+    else:
+        chunks = pd.read_csv(path, encoding="utf-8-sig", usecols=list(SCHEMA),
+                             dtype=_parse_dtypes(), chunksize=CHUNK_SIZE)
+        data = pd.concat([_validate_and_downcast(chunk) for chunk in chunks], ignore_index=True)
+        data = data[list(SCHEMA)]
+
+        if cached_file:
+            _write_cache(data, cached_file, cache_format)
+
+    if categorical:
+        data = _to_categorical(data)
+
+    return data
+
+
+# -------------------------------------------------
+# Benchmark: memory and load time at `rows` rows
+# -------------------------------------------------
+def benchmark_loader(rows=1_000_000, path=DATASET_FILE):
+    base = pd.read_csv(path, encoding="utf-8-sig")
+    results = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        big_file = os.path.join(temp_dir, "heart_disease_big.csv")
+        big = base.sample(n=rows, replace=True, random_state=42)
+        with open(big_file, "w", newline="", encoding="utf-8-sig") as f:
+            big.to_csv(f, index=False)
+
+        def measure(label, load):
+            start = time.perf_counter()
+            data = load()
+            seconds = time.perf_counter() - start
+            results.append({'Method': label, 'Load (s)': round(seconds, 3),
+                            'Memory (MB)': round(data.memory_usage(deep=True).sum() / 1e6, 1)})
+
+        measure("pd.read_csv (default dtypes)", lambda: pd.read_csv(big_file))
+        measure("load_heart_disease (schema)", lambda: load_heart_disease(big_file))
+        measure("load_heart_disease (write npz cache)", lambda: load_heart_disease(big_file, cache=True))
+        measure("load_heart_disease (npz cache hit)", lambda: load_heart_disease(big_file, cache=True))
+
+    results_df = pd.DataFrame(results)
+    print(f"Benchmark with {rows} row(s):")
+    print(results_df.to_string(index=False))
+    return results_df
+
+
+if __name__ == "__main__":
+    benchmark_loader(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
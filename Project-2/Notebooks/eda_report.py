@@ -0,0 +1,257 @@
+# ============================================
+# Headless EDA Report Module
+# ============================================
+# Renders the EDA figures of heart_disease.ipynb without a display:
+#   - figures are drawn on the Agg backend in parallel worker processes
+#   - large datasets are binned / sampled before anything is plotted
+#   - every figure is cached by a hash of its input columns and parameters,
+#     so unchanged figures are not drawn again (a PNG is written under a
+#     temporary name and renamed, so a crash never leaves a partial file
+#     that would count as cached)
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FIGURES_DIR = os.path.join(SCRIPT_DIR, "..", "Reports", "figures")
+
+FIGURE_VERSION = 1         # bump when the drawing code changes to invalidate the cache
+MAX_PLOT_POINTS = 5000     # max rows used for scatter / pair / KDE plots
+HIST_BINS = 30
+KDE_POINTS = 200
+
+CONTINUOUS_FEATURES = ['age', 'trestbps', 'chol', 'thalach', 'oldpeak']
+TARGET = 'target'
+PALETTE = {0: 'blue', 1: 'red'}
+
+SCATTER_PAIRS = [
+    ('age', 'thalach', 'Age vs Max Heart Rate'),
+    ('age', 'chol', 'Age vs Cholesterol'),
+    ('age', 'trestbps', 'Age vs Blood Pressure'),
+    ('trestbps', 'chol', 'Blood Pressure vs Cholesterol'),
+    ('thalach', 'oldpeak', 'Max Heart Rate vs ST Depression'),
+    ('age', 'oldpeak', 'Age vs ST Depression'),
+    ('chol', 'thalach', 'Cholesterol vs Max Heart Rate'),
+    ('trestbps', 'thalach', 'Blood Pressure vs Max Heart Rate'),
+    ('chol', 'oldpeak', 'Cholesterol vs ST Depression')
+]
+
+
+# -------------------------------------------------
+# Default list of figures (mirrors the notebook's EDA section)
+# -------------------------------------------------
+def default_figure_specs(data):
+    specs = []
+
+    for col in data.columns:
+        specs.append({"name": f"hist_{col}", "kind": "hist", "columns": [col],
+                      "params": {"bins": HIST_BINS}, "title": f"Distribution of {col}"})
+        specs.append({"name": f"box_{col}", "kind": "box", "columns": [col],
+                      "params": {}, "title": f"Boxplot of {col}"})
+
+    specs.append({"name": "corr_heatmap", "kind": "heatmap", "columns": list(data.columns),
+                  "params": {}, "title": "Correlation Matrix"})
+
+    if TARGET in data.columns:
+        specs.append({"name": "pairplot", "kind": "pairplot", "columns": CONTINUOUS_FEATURES + [TARGET],
+                      "params": {"max_points": MAX_PLOT_POINTS},
+                      "title": "Pairplot of Key Features by Heart Disease Status"})
+
+        for x_feature, y_feature, title in SCATTER_PAIRS:
+            specs.append({"name": f"scatter_{x_feature}_{y_feature}", "kind": "scatter",
+                          "columns": [x_feature, y_feature, TARGET],
+                          "params": {"max_points": MAX_PLOT_POINTS}, "title": title})
+
+    return specs
+
+
+# -------------------------------------------------
+# Helper: cache key of a figure (input columns + parameters)
+# -------------------------------------------------
+def figure_key(data, spec):
+    digest = hashlib.sha256()
+    digest.update(json.dumps([FIGURE_VERSION, spec["kind"], spec["title"], spec["params"]],
+                             sort_keys=True).encode("utf-8"))
+
+    for col in spec["columns"]:
+        digest.update(f"{col}:{data[col].dtype}".encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(data[col], index=False).to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+# -------------------------------------------------
+# Helper: random sample of at most `max_points` rows
+# -------------------------------------------------
+def _sample(frame, max_points):
+    if len(frame) <= max_points:
+        return frame
+    return frame.sample(n=max_points, random_state=42)
+
+
+# -------------------------------------------------
+# Helper: reduce the data of one figure to a small payload
+# -------------------------------------------------
+def _prepare_payload(data, spec):
+    kind = spec["kind"]
+
+    if kind == "hist":
+        values = data[spec["columns"][0]].dropna().to_numpy(dtype=np.float64)
+        counts, edges = np.histogram(values, bins=spec["params"]["bins"])
+
+        # KDE on a sample, scaled to the histogram counts like seaborn's histplot
+        kde_x = np.linspace(edges[0], edges[-1], KDE_POINTS)
+        kde_y = None
+        sample = _sample(pd.Series(values), MAX_PLOT_POINTS).to_numpy()
+        if len(np.unique(sample)) > 1:
+            kde_y = stats.gaussian_kde(sample)(kde_x) * len(values) * (edges[1] - edges[0])
+
+        return {"counts": counts, "edges": edges, "kde_x": kde_x, "kde_y": kde_y,
+                "mean": values.mean(), "median": np.median(values)}
+
+    if kind == "box":
+        values = data[spec["columns"][0]].dropna().to_numpy(dtype=np.float64)
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        lower_bound = q1 - 1.5 * (q3 - q1)
+        upper_bound = q3 + 1.5 * (q3 - q1)
+        inside = values[(values >= lower_bound) & (values <= upper_bound)]
+        fliers = values[(values < lower_bound) | (values > upper_bound)]
+
+        return {"stats": {"med": median, "q1": q1, "q3": q3,
+                          "whislo": inside.min(), "whishi": inside.max(),
+                          "fliers": _sample(pd.Series(fliers), MAX_PLOT_POINTS).to_numpy()}}
+
+    if kind == "heatmap":
+        return {"corr": data[spec["columns"]].corr()}
+
+    if kind in ("pairplot", "scatter"):
+        return {"sample": _sample(data[spec["columns"]].dropna(), spec["params"]["max_points"])}
+
+    raise ValueError(f"Unknown figure kind '{kind}'.")
+
+
+# -------------------------------------------------
+# Helper: save a figure as PNG atomically (temporary file, then rename)
+# -------------------------------------------------
+def _save_png(fig, path, **kwargs):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        fig.savefig(temp_path, format="png", **kwargs)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+# -------------------------------------------------
+# Helper: draw one figure from its payload and save it as PNG
+# Always runs in a worker process (Agg backend, see render_report)
+# -------------------------------------------------
+def _render_figure(spec, payload, path):
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    kind = spec["kind"]
+    col = spec["columns"][0]
+
+    if kind == "pairplot":
+        import matplotlib.pyplot as plt
+
+        pairplot = sns.pairplot(payload["sample"], hue=TARGET, palette=PALETTE, diag_kind='kde',
+                                plot_kws={'alpha': 0.6}, corner=False)
+        pairplot.figure.suptitle(spec["title"], y=1.02, fontsize=16)
+        _save_png(pairplot.figure, path, bbox_inches="tight")
+        plt.close(pairplot.figure)
+        return path
+
+    if kind == "hist":
+        fig = Figure(figsize=(6, 4))
+        ax = fig.subplots()
+        ax.stairs(payload["counts"], payload["edges"], fill=True, color="blue", alpha=0.5)
+        if payload["kde_y"] is not None:
+            ax.plot(payload["kde_x"], payload["kde_y"], color="blue")
+        ax.axvline(payload["mean"], color='red', linestyle='dashed', linewidth=1)
+        ax.axvline(payload["median"], color='green', linestyle='dashed', linewidth=1)
+        ax.set_xlabel(col)
+        ax.set_ylabel("Count")
+
+    elif kind == "box":
+        fig = Figure(figsize=(10, 3))
+        ax = fig.subplots()
+        ax.bxp([payload["stats"]], vert=False, patch_artist=True,
+               boxprops={"facecolor": "skyblue"})
+        ax.set_xlabel(col)
+        ax.set_yticks([])
+
+    elif kind == "heatmap":
+        fig = Figure(figsize=(18, 12))
+        ax = fig.subplots()
+        sns.heatmap(payload["corr"], annot=True, fmt='.2f', cmap='coolwarm', ax=ax)
+
+    elif kind == "scatter":
+        x_feature, y_feature = spec["columns"][0], spec["columns"][1]
+        sample = payload["sample"]
+        fig = Figure(figsize=(6, 5))
+        ax = fig.subplots()
+        for target_val in [0, 1]:
+            mask = sample[TARGET] == target_val
+            ax.scatter(sample.loc[mask, x_feature], sample.loc[mask, y_feature],
+                       label="No Disease" if target_val == 0 else "Disease",
+                       alpha=0.6, c=PALETTE[target_val], edgecolors='black', linewidth=0.5)
+        ax.set_xlabel(x_feature, fontsize=10)
+        ax.set_ylabel(y_feature, fontsize=10)
+        ax.legend(loc='best', fontsize=8)
+        ax.grid(True, alpha=0.3)
+
+    else:
+        raise ValueError(f"Unknown figure kind '{kind}'.")
+
+    ax.set_title(spec["title"])
+    fig.tight_layout()
+    _save_png(fig, path)
+    return path
+
+
+# -------------------------------------------------
+# Helper: worker start-up (headless backend)
+# -------------------------------------------------
+def _init_worker():
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+# -------------------------------------------------
+# Render all figures (cached, in parallel)
+# -------------------------------------------------
+def render_report(data, specs=None, output_dir=FIGURES_DIR, workers=None):
+    if specs is None:
+        specs = default_figure_specs(data)
+    os.makedirs(output_dir, exist_ok=True)
+
+    figures = {}
+    jobs = []
+    for spec in specs:
+        path = os.path.join(output_dir, f"{spec['name']}_{figure_key(data, spec)[:16]}.png")
+        figures[spec["name"]] = path
+        if not os.path.exists(path):
+            jobs.append((spec, _prepare_payload(data, spec), path))
+
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+
+    # Even one worker is a separate process, so the caller's backend
+    # (e.g. the notebook's inline backend) is never used or changed
+    if jobs:
+        with ProcessPoolExecutor(max_workers=max(workers, 1), initializer=_init_worker) as pool:
+            futures = [pool.submit(_render_figure, spec, payload, path) for spec, payload, path in jobs]
+            for future in futures:
+                future.result()
+
+    print(f"Rendered {len(jobs)} figure(s), {len(specs) - len(jobs)} from cache, in '{output_dir}'.")
+    return figures
@@ -0,0 +1,468 @@
+# ============================================
+# Streaming EDA Statistics Module
+# ============================================
+# Computes every statistic of the EDA section (describe, median, quantiles,
+# skewness, kurtosis, value counts, correlation, duplicates, t-tests and
+# chi-square tests) in ONE chunked pass over the CSV file.
+#
+# Each chunk is reduced to a small "state" dictionary (online moments,
+# quantile sketches, counters and a covariance matrix). States are
+# mergeable, so chunks can be processed on a process pool and combined,
+# and the file never has to fit in memory.
+#
+# Memory limit: duplicate detection is exact, so the state keeps one 8-byte
+# hash per distinct row of every chunk (about 80 MB per 10 million rows).
+# The per-chunk hash arrays are only deduplicated once, in finalize_report,
+# one hash range at a time.
+
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+CONTINUOUS_FEATURES = ['age', 'trestbps', 'chol', 'thalach', 'oldpeak']
+CATEGORICAL_FEATURES = ['sex', 'cp', 'fbs', 'restecg', 'exang', 'slope', 'ca', 'thal']
+TARGET = 'target'
+
+CHUNK_SIZE = 100_000          # rows per chunk read from the CSV
+QUANTILE_SKETCH_SIZE = 2048   # max distinct values kept per column sketch
+SIGNIFICANCE_LEVEL = 0.05
+DEDUPE_PARTITIONS = 16        # hash ranges deduplicated one at a time in finalize_report
+
+
+# -------------------------------------------------
+# Helper: online moments (count, mean, M2, M3, M4) of every column
+# -------------------------------------------------
+def _moments(values):
+    mask = ~np.isnan(values)
+    count = mask.sum(axis=0).astype(np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, np.where(mask, values, 0.0).sum(axis=0) / count, 0.0)
+
+    delta = np.where(mask, values - mean, 0.0)
+    delta2 = delta * delta
+
+    return {
+        "count": count,
+        "mean": mean,
+        "m2": delta2.sum(axis=0),
+        "m3": (delta2 * delta).sum(axis=0),
+        "m4": (delta2 * delta2).sum(axis=0),
+    }
+
+
+# -------------------------------------------------
+# Helper: merge two moment sets (Chan / Pebay pairwise update)
+# -------------------------------------------------
+def _merge_moments(a, b):
+    na, nb = a["count"], b["count"]
+    n = na + nb
+    n_safe = np.where(n == 0, 1.0, n)
+    delta = b["mean"] - a["mean"]
+
+    mean = a["mean"] + delta * nb / n_safe
+    m2 = a["m2"] + b["m2"] + delta ** 2 * na * nb / n_safe
+    m3 = (a["m3"] + b["m3"]
+          + delta ** 3 * na * nb * (na - nb) / n_safe ** 2
+          + 3 * delta * (na * b["m2"] - nb * a["m2"]) / n_safe)
+    m4 = (a["m4"] + b["m4"]
+          + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n_safe ** 3
+          + 6 * delta ** 2 * (na * na * b["m2"] + nb * nb * a["m2"]) / n_safe ** 2
+          + 4 * delta * (na * b["m3"] - nb * a["m3"]) / n_safe)
+
+    return {"count": n, "mean": mean, "m2": m2, "m3": m3, "m4": m4}
+
+
+# -------------------------------------------------
+# Helper: shrink a sketch to at most `size` weighted centroids
+# -------------------------------------------------
+def _compress_sketch(values, weights, size):
+    cumulative = np.cumsum(weights)
+    bucket = ((cumulative - weights) / cumulative[-1] * size).astype(np.int64)
+    bucket = np.minimum(bucket, size - 1)
+
+    new_weights = np.bincount(bucket, weights=weights, minlength=size)
+    new_values = np.bincount(bucket, weights=weights * values, minlength=size)
+    keep = new_weights > 0
+
+    return new_values[keep] / new_weights[keep], new_weights[keep]
+
+
+# -------------------------------------------------
+# Helper: merge two quantile sketches (value -> weight)
+# -------------------------------------------------
+def _merge_sketches(a, b, size=QUANTILE_SKETCH_SIZE):
+    values = np.concatenate([a["values"], b["values"]])
+    weights = np.concatenate([a["weights"], b["weights"]])
+    values, inverse = np.unique(values, return_inverse=True)
+    weights = np.bincount(inverse, weights=weights)
+    exact = a["exact"] and b["exact"]
+
+    if len(values) > size:
+        values, weights = _compress_sketch(values, weights, size)
+        exact = False
+
+    return {"values": values, "weights": weights, "exact": exact}
+
+
+# -------------------------------------------------
+# Helper: quantile from a sketch (linear interpolation, same as pandas)
+# -------------------------------------------------
+def _sketch_quantile(sketch, q):
+    weights = sketch["weights"]
+    if len(weights) == 0:
+        return np.nan
+
+    cumulative = np.cumsum(weights)
+    position = (cumulative[-1] - 1) * q
+    lower = np.floor(position)
+    upper = np.ceil(position)
+
+    last = len(weights) - 1
+    value_lower = sketch["values"][min(np.searchsorted(cumulative, lower, side="right"), last)]
+    value_upper = sketch["values"][min(np.searchsorted(cumulative, upper, side="right"), last)]
+
+    return value_lower + (position - lower) * (value_upper - value_lower)
+
+
+# -------------------------------------------------
+# Build the state of one chunk
+# -------------------------------------------------
+def chunk_state(chunk, continuous_features=CONTINUOUS_FEATURES,
+                categorical_features=CATEGORICAL_FEATURES, target=TARGET):
+    columns = list(chunk.columns)
+    values = chunk.to_numpy(dtype=np.float64)
+    mask = ~np.isnan(values)
+
+    # Quantile sketches (exact value counts while the column stays small)
+    sketches = {}
+    for i, col in enumerate(columns):
+        col_values, col_counts = np.unique(values[mask[:, i], i], return_counts=True)
+        sketches[col] = _merge_sketches(
+            {"values": col_values, "weights": col_counts.astype(np.float64), "exact": True},
+            {"values": np.empty(0), "weights": np.empty(0), "exact": True},
+        )
+
+    # Covariance matrix on complete rows
+    complete = values[mask.all(axis=1)]
+    cov_mean = complete.mean(axis=0) if len(complete) else np.zeros(len(columns))
+    centered = complete - cov_mean
+
+    # Per-target moments and contingency counts
+    groups = {}
+    crosstabs = {}
+    if target in chunk.columns:
+        other_columns = [col for col in columns if col != target]
+        for target_value, group in chunk.groupby(target):
+            groups[target_value] = _moments(group[other_columns].to_numpy(dtype=np.float64))
+
+        for feature in categorical_features:
+            if feature in chunk.columns:
+                crosstabs[feature] = Counter(chunk.groupby([feature, target]).size().to_dict())
+
+    return {
+        "columns": columns,
+        "continuous_features": [f for f in continuous_features if f in columns],
+        "categorical_features": [f for f in categorical_features if f in columns],
+        "target": target if target in columns else None,
+        "rows": len(chunk),
+        "nulls": (~mask).sum(axis=0),
+        "moments": _moments(values),
+        "min": np.where(mask, values, np.inf).min(axis=0, initial=np.inf),
+        "max": np.where(mask, values, -np.inf).max(axis=0, initial=-np.inf),
+        "sketches": sketches,
+        "cov_count": len(complete),
+        "cov_mean": cov_mean,
+        "cov_comoment": centered.T @ centered,
+        "groups": groups,
+        "crosstabs": crosstabs,
+        "row_hashes": [np.unique(pd.util.hash_pandas_object(chunk, index=False).to_numpy())],
+    }
+
+
+# -------------------------------------------------
+# Merge two chunk states
+# -------------------------------------------------
+def merge_states(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a["columns"] != b["columns"]:
+        raise ValueError("Cannot merge states of chunks with different columns.")
+
+    # Streaming covariance
+    na, nb = a["cov_count"], b["cov_count"]
+    n = na + nb
+    delta = b["cov_mean"] - a["cov_mean"]
+    if n > 0:
+        cov_mean = a["cov_mean"] + delta * nb / n
+        cov_comoment = a["cov_comoment"] + b["cov_comoment"] + np.outer(delta, delta) * na * nb / n
+    else:
+        cov_mean, cov_comoment = a["cov_mean"], a["cov_comoment"]
+
+    groups = dict(a["groups"])
+    for key, moments in b["groups"].items():
+        groups[key] = _merge_moments(groups[key], moments) if key in groups else moments
+
+    crosstabs = {feature: counts.copy() for feature, counts in a["crosstabs"].items()}
+    for feature, counts in b["crosstabs"].items():
+        crosstabs.setdefault(feature, Counter()).update(counts)
+
+    return {
+        "columns": a["columns"],
+        "continuous_features": a["continuous_features"],
+        "categorical_features": a["categorical_features"],
+        "target": a["target"],
+        "rows": a["rows"] + b["rows"],
+        "nulls": a["nulls"] + b["nulls"],
+        "moments": _merge_moments(a["moments"], b["moments"]),
+        "min": np.minimum(a["min"], b["min"]),
+        "max": np.maximum(a["max"], b["max"]),
+        "sketches": {col: _merge_sketches(a["sketches"][col], b["sketches"][col]) for col in a["columns"]},
+        "cov_count": n,
+        "cov_mean": cov_mean,
+        "cov_comoment": cov_comoment,
+        "groups": groups,
+        "crosstabs": crosstabs,
+        "row_hashes": a["row_hashes"] + b["row_hashes"],   # sorted per chunk, deduplicated in finalize_report
+    }
+
+
+# -------------------------------------------------
+# Helper: pandas-compatible skewness and (excess) kurtosis
+# -------------------------------------------------
+def _skew_kurtosis(moments):
+    n, m2, m3, m4 = moments["count"], moments["m2"], moments["m3"], moments["m4"]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        skew = np.sqrt(n * (n - 1)) / (n - 2) * (np.sqrt(n) * m3 / m2 ** 1.5)
+        kurtosis = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                    - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+
+    skew = np.where(m2 == 0, 0.0, np.where(n < 3, np.nan, skew))
+    kurtosis = np.where(m2 == 0, 0.0, np.where(n < 4, np.nan, kurtosis))
+    return skew, kurtosis
+
+
+# -------------------------------------------------
+# Helper: independent two-sample t-tests from group moments
+# -------------------------------------------------
+def _t_tests(state):
+    columns = [col for col in state["columns"] if col != state["target"]]
+    group_keys = sorted(state["groups"])
+    if len(group_keys) != 2:
+        return pd.DataFrame()
+
+    first, second = state["groups"][group_keys[0]], state["groups"][group_keys[1]]
+    results = []
+
+    for feature in state["continuous_features"]:
+        i = columns.index(feature)
+        n1, n2 = first["count"][i], second["count"][i]
+        mean1, mean2 = first["mean"][i], second["mean"][i]
+
+        # Pooled variance (same as scipy.stats.ttest_ind with equal_var=True)
+        dof = n1 + n2 - 2
+        pooled_var = (first["m2"][i] + second["m2"][i]) / dof
+        t_statistic = (mean1 - mean2) / np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+        p_value = 2 * stats.t.sf(abs(t_statistic), dof)
+
+        results.append({
+            'Feature': feature,
+            'Mean (No Disease)': mean1,
+            'Mean (Disease)': mean2,
+            'Difference': mean2 - mean1,
+            't-statistic': t_statistic,
+            'p-value': p_value,
+            'Significant': "YES" if p_value < SIGNIFICANCE_LEVEL else "NO"
+        })
+
+    return pd.DataFrame(results)
+
+
+# -------------------------------------------------
+# Helper: chi-square tests from contingency counters
+# -------------------------------------------------
+def _chi_square_tests(state):
+    results = []
+    tables = {}
+
+    for feature in state["categorical_features"]:
+        counts = state["crosstabs"].get(feature)
+        if not counts:
+            continue
+
+        table = pd.Series(counts).unstack(fill_value=0).sort_index().sort_index(axis=1)
+        table.index.name = feature
+        table.columns.name = state["target"]
+        tables[feature] = table
+
+        chi2_statistic, p_value, dof, expected_freq = stats.chi2_contingency(table)
+        results.append({
+            'Feature': feature,
+            'Chi-square': chi2_statistic,
+            'Degrees of Freedom': dof,
+            'p-value': p_value,
+            'Significant': "YES" if p_value < SIGNIFICANCE_LEVEL else "NO"
+        })
+
+    return pd.DataFrame(results), tables
+
+
+# -------------------------------------------------
+# Helper: number of distinct row hashes over all chunks
+# Every chunk array is sorted, so each hash range is a slice of it and only
+# one range at a time is copied and deduplicated.
+# -------------------------------------------------
+def _count_distinct_rows(hash_arrays, partitions=DEDUPE_PARTITIONS):
+    bounds = np.array([i * (2 ** 64 // partitions) for i in range(1, partitions)], dtype=np.uint64)
+    cuts = [np.concatenate(([0], np.searchsorted(hashes, bounds), [len(hashes)])) for hashes in hash_arrays]
+
+    distinct = 0
+    for p in range(partitions):
+        part = np.concatenate([hashes[c[p]:c[p + 1]] for hashes, c in zip(hash_arrays, cuts)]
+                              + [np.empty(0, dtype=np.uint64)])
+        distinct += len(np.unique(part))
+    return distinct
+
+
+# -------------------------------------------------
+# Turn a merged state into the EDA report
+# -------------------------------------------------
+def finalize_report(state):
+    columns = state["columns"]
+    moments = state["moments"]
+    count = moments["count"]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(moments["m2"] / (count - 1))
+    mean = np.where(count > 0, moments["mean"], np.nan)
+    minimum = np.where(count > 0, state["min"], np.nan)
+    maximum = np.where(count > 0, state["max"], np.nan)
+
+    quantiles = pd.DataFrame(
+        {col: [_sketch_quantile(state["sketches"][col], q) for q in (0.25, 0.5, 0.75)] for col in columns},
+        index=[0.25, 0.5, 0.75]
+    )
+
+    describe = pd.DataFrame(
+        [count, mean, std, minimum, quantiles.loc[0.25], quantiles.loc[0.5], quantiles.loc[0.75], maximum],
+        index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+        columns=columns
+    )
+
+    skew, kurtosis = _skew_kurtosis(moments)
+
+    # Value counts are only reported for columns whose sketch is still exact
+    value_counts = {}
+    for col in columns:
+        sketch = state["sketches"][col]
+        if sketch["exact"]:
+            counts = pd.Series(sketch["weights"].astype(np.int64), index=sketch["values"], name="count")
+            counts.index.name = col
+            value_counts[col] = counts
+
+    # Correlation from the streaming covariance matrix
+    comoment = state["cov_comoment"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.sqrt(np.diag(comoment))
+        corr = comoment / np.outer(scale, scale)
+
+    # Mean of every feature per target class
+    grouped_mean = pd.DataFrame()
+    if state["groups"]:
+        other_columns = [col for col in columns if col != state["target"]]
+        keys = sorted(state["groups"])
+        grouped_mean = pd.DataFrame([state["groups"][key]["mean"] for key in keys],
+                                    index=pd.Index(keys, name=state["target"]), columns=other_columns)
+
+    chi_square, contingency_tables = _chi_square_tests(state)
+
+    return {
+        "shape": (state["rows"], len(columns)),
+        "null_counts": pd.Series(state["nulls"], index=columns),
+        "duplicates": state["rows"] - _count_distinct_rows(state["row_hashes"]),
+        "describe": describe,
+        "median": quantiles.loc[0.5].rename(None),
+        "quantiles": quantiles,
+        "skew": pd.Series(skew, index=columns),
+        "kurtosis": pd.Series(kurtosis, index=columns),
+        "value_counts": value_counts,
+        "corr": pd.DataFrame(corr, index=columns, columns=columns),
+        "grouped_mean": grouped_mean,
+        "t_tests": _t_tests(state),
+        "chi_square": chi_square,
+        "contingency_tables": contingency_tables,
+    }
+
+
+# -------------------------------------------------
+# Helper: compute chunk states, optionally on a process pool
+# -------------------------------------------------
+def _iter_states(chunks, state_function, workers):
+    if workers <= 1:
+        for chunk in chunks:
+            yield state_function(chunk)
+        return
+
+    # Keep only a few chunks in flight so memory stays bounded
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(state_function, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# -------------------------------------------------
+# Full report from a CSV file in one chunked pass
+# -------------------------------------------------
+def compute_eda_report(path, chunksize=CHUNK_SIZE, workers=None,
+                       continuous_features=CONTINUOUS_FEATURES,
+                       categorical_features=CATEGORICAL_FEATURES, target=TARGET):
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    state_function = partial(chunk_state, continuous_features=continuous_features,
+                             categorical_features=categorical_features, target=target)
+    chunks = pd.read_csv(path, chunksize=chunksize, encoding="utf-8-sig")
+
+    state = None
+    n_chunks = 0
+    for chunk_result in _iter_states(chunks, state_function, workers):
+        state = merge_states(state, chunk_result)
+        n_chunks += 1
+
+    if state is None:
+        raise ValueError(f"File '{path}' contains no rows.")
+
+    print(f"Processed {state['rows']} row(s) from '{path}' in {n_chunks} chunk(s).")
+    return finalize_report(state)
+
+
+# -------------------------------------------------
+# Same report for a DataFrame that is already in memory
+# -------------------------------------------------
+def compute_eda_report_from_frame(data, continuous_features=CONTINUOUS_FEATURES,
+                                  categorical_features=CATEGORICAL_FEATURES, target=TARGET):
+    return finalize_report(chunk_state(data, continuous_features, categorical_features, target))
+
+
+if __name__ == "__main__":
+    default_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Datasets", "heart_disease.csv")
+    report = compute_eda_report(sys.argv[1] if len(sys.argv) > 1 else default_path)
+
+    print("Shape (Rows, Columns): ", report["shape"])
+    print("Number of duplicate rows: ", report["duplicates"])
+    print(report["describe"])
+    print(report["t_tests"].to_string(index=False))
+    print(report["chi_square"].to_string(index=False))
@@ -0,0 +1,185 @@
+# ============================================
+# Feature Importance Module
+# ============================================
+# 1. Permutation importance spread over a process pool. Every
+#    (feature, repeat) pair is one job, and the test matrix lives in shared
+#    memory so it is not pickled to every worker.
+# 2. The notebook's combined statistical importance score
+#    (correlation + t-test + chi-square) computed for all features at once.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from sklearn.metrics import get_scorer
+from sklearn.utils import Bunch, check_random_state
+
+CONTINUOUS_FEATURES = ['age', 'trestbps', 'chol', 'thalach', 'oldpeak']
+CATEGORICAL_FEATURES = ['sex', 'cp', 'fbs', 'restecg', 'exang', 'slope', 'ca', 'thal']
+TARGET = 'target'
+
+# Weights of the combined importance score (same as the notebook)
+P_VALUE_WEIGHT = 0.30
+EFFECT_SIZE_WEIGHT = 0.35
+CORRELATION_WEIGHT = 0.35
+
+_worker = {}   # per-process state used by the permutation jobs
+
+
+# -------------------------------------------------
+# Helper: set up the state used by the permutation jobs
+# -------------------------------------------------
+def _setup_worker(X, estimator, y, scoring, seed):
+    _worker["X"] = X
+    _worker["X_permuted"] = X.copy()   # one private copy per process, restored after each job
+    _worker["estimator"] = estimator
+    _worker["y"] = y
+    _worker["scorer"] = get_scorer(scoring)
+    _worker["seed"] = seed
+
+
+# -------------------------------------------------
+# Helper: worker start-up, attaching to the shared feature matrix
+# -------------------------------------------------
+def _init_worker(shm_name, shape, dtype, estimator, y, scoring, seed):
+    shm = SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _setup_worker(np.ndarray(shape, dtype=dtype, buffer=shm.buf), estimator, y, scoring, seed)
+
+
+# -------------------------------------------------
+# Helper: score of the model with one feature permuted
+# -------------------------------------------------
+def _permuted_score(job):
+    col_idx, repeat = job
+    X, X_permuted = _worker["X"], _worker["X_permuted"]
+
+    # Rebuild the same cumulative shuffles as sklearn.inspection.permutation_importance
+    random_state = np.random.RandomState(_worker["seed"])
+    shuffling_idx = np.arange(X.shape[0])
+    column = X[:, col_idx].copy()
+    for _ in range(repeat + 1):
+        random_state.shuffle(shuffling_idx)
+        column = column[shuffling_idx]
+
+    X_permuted[:, col_idx] = column
+    score = _worker["scorer"](_worker["estimator"], X_permuted, _worker["y"])
+    X_permuted[:, col_idx] = X[:, col_idx]
+
+    return score
+
+
+# -------------------------------------------------
+# Parallel permutation importance (drop-in for sklearn's version)
+# -------------------------------------------------
+def permutation_importance(estimator, X, y, n_repeats=10, random_state=None,
+                           scoring='accuracy', workers=None):
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.asarray(y)
+    seed = check_random_state(random_state).randint(np.iinfo(np.int32).max + 1)
+    jobs = [(col_idx, repeat) for col_idx in range(X.shape[1]) for repeat in range(n_repeats)]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        _setup_worker(X, estimator, y, scoring, seed)
+        scores = [_permuted_score(job) for job in jobs]
+    else:
+        shm = SharedMemory(create=True, size=X.nbytes)
+        try:
+            shared_X = np.ndarray(X.shape, dtype=X.dtype, buffer=shm.buf)
+            shared_X[:] = X
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(shm.name, X.shape, X.dtype.str,
+                                               estimator, y, scoring, seed)) as pool:
+                scores = list(pool.map(_permuted_score, jobs,
+                                       chunksize=max(1, len(jobs) // (4 * workers))))
+            del shared_X
+        finally:
+            shm.close()
+            shm.unlink()
+
+    _worker.clear()
+
+    baseline_score = get_scorer(scoring)(estimator, X, y)
+    importances = baseline_score - np.array(scores).reshape(X.shape[1], n_repeats)
+
+    return Bunch(importances_mean=importances.mean(axis=1),
+                 importances_std=importances.std(axis=1),
+                 importances=importances)
+
+
+# -------------------------------------------------
+# Helper: chi-square test of every categorical feature against the target
+# -------------------------------------------------
+def _chi_square_tests(data, categorical_features, target):
+    long = data[categorical_features + [target]].melt(id_vars=target, var_name='feature')
+    observed = long.groupby(['feature', 'value', target]).size().unstack(fill_value=0)
+    observed = observed.astype(np.float64)
+
+    feature_of_row = observed.index.get_level_values('feature')
+    column_totals = observed.groupby(level='feature').sum()
+    totals = column_totals.sum(axis=1)
+
+    expected = (observed.sum(axis=1).to_numpy()[:, None]
+                * column_totals.loc[feature_of_row].to_numpy()
+                / totals.loc[feature_of_row].to_numpy()[:, None])
+
+    n_rows = observed.groupby(level='feature').size()
+    n_columns = (column_totals > 0).sum(axis=1)
+    dof = (n_rows - 1) * (n_columns - 1)
+
+    # Yates' continuity correction for 2x2 tables (same as scipy's chi2_contingency)
+    observed = observed.to_numpy()
+    yates = (dof.loc[feature_of_row] == 1).to_numpy()[:, None]
+    difference = expected - observed
+    observed = np.where(yates, observed + np.sign(difference) * np.minimum(0.5, np.abs(difference)), observed)
+
+    terms = pd.DataFrame((observed - expected) ** 2 / expected, index=feature_of_row)
+    chi2_statistic = terms.sum(axis=1).groupby(level=0).sum().loc[categorical_features]
+    dof = dof.loc[categorical_features]
+
+    return chi2_statistic.to_numpy(), stats.chi2.sf(chi2_statistic.to_numpy(), dof.to_numpy())
+
+
+# -------------------------------------------------
+# Combined statistical importance score (correlation + t-test + chi-square)
+# -------------------------------------------------
+def statistical_importance(data, continuous_features=CONTINUOUS_FEATURES,
+                           categorical_features=CATEGORICAL_FEATURES, target=TARGET):
+    features = continuous_features + categorical_features
+    correlation = data[features].corrwith(data[target]).abs().to_numpy()
+
+    # T-test of all continuous features at once
+    no_disease = data.loc[data[target] == 0, continuous_features].to_numpy(dtype=np.float64)
+    disease = data.loc[data[target] == 1, continuous_features].to_numpy(dtype=np.float64)
+    t_statistic, t_p_value = stats.ttest_ind(no_disease, disease, axis=0)
+    mean_diff = np.abs(disease.mean(axis=0) - no_disease.mean(axis=0))
+
+    chi2_statistic, chi2_p_value = _chi_square_tests(data, categorical_features, target)
+
+    p_value = np.concatenate([t_p_value, chi2_p_value])
+    effect_size = np.concatenate([mean_diff, chi2_statistic])
+
+    p_value_score = np.where(p_value < 0.001, 1.0, np.where(p_value < 1, 1 - p_value, 0.0))
+    effect_size_score = (effect_size - effect_size.min()) / (effect_size.max() - effect_size.min())
+
+    importance_df = pd.DataFrame({
+        'Feature': features,
+        'Type': ['Continuous'] * len(continuous_features) + ['Categorical'] * len(categorical_features),
+        'P-value': p_value,
+        'Effect Size': effect_size,
+        'Correlation': correlation,
+        'P-value Score': p_value_score,
+        'Effect Size Score': effect_size_score,
+        'Correlation Score': correlation,
+        'Combined Importance Score': (P_VALUE_WEIGHT * p_value_score
+                                      + EFFECT_SIZE_WEIGHT * effect_size_score
+                                      + CORRELATION_WEIGHT * correlation)
+    })
+
+    return importance_df.sort_values('Combined Importance Score', ascending=False).reset_index(drop=True)
@@ -0,0 +1,232 @@
+# ============================================
+# Incremental Model Training Module
+# ============================================
+# Retrains the heart-disease KNN model as new patient records arrive,
+# without starting from scratch:
+#   - the StandardScaler keeps running mean/variance via partial_fit
+#   - new rows are appended to the KNN reference set (no re-tuning,
+#     no rescaling of the history)
+#   - the full GridSearchCV only runs again when the streaming statistics
+#     of the new rows drift away from the data the model was tuned on
+
+import copy
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import GridSearchCV
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import StandardScaler
+
+import eda_stats
+
+# Same grid as the notebook
+PARAM_GRID_KNN = {
+    'n_neighbors': list(range(1, 31)),
+    'weights': ['uniform', 'distance'],
+    'metric': ['euclidean', 'manhattan']
+}
+
+DRIFT_THRESHOLD = 0.25   # max standardized mean shift before re-tuning
+MIN_DRIFT_ROWS = 200     # new rows needed before the drift check is trusted
+CV_FOLDS = 5
+
+
+# -------------------------------------------------
+# Helper: append rows to a growable buffer (capacity doubles when full)
+# -------------------------------------------------
+def _append_rows(buffer, size, rows):
+    needed = size + len(rows)
+    if needed > len(buffer):
+        new_buffer = np.empty((max(needed, 2 * len(buffer)),) + buffer.shape[1:], dtype=buffer.dtype)
+        new_buffer[:size] = buffer[:size]
+        buffer = new_buffer
+
+    buffer[size:needed] = rows
+    return buffer
+
+
+# -------------------------------------------------
+# Helper: streaming statistics of a batch of rows
+# Only the row count and the online moments: the drift check needs nothing
+# else, and merging them costs O(columns) whatever the history size.
+# -------------------------------------------------
+def _batch_stats(X):
+    return {"rows": len(X), "moments": eda_stats._moments(X.to_numpy(dtype=np.float64))}
+
+
+# -------------------------------------------------
+# Helper: merge two batch statistics (either may be None)
+# -------------------------------------------------
+def _merge_stats(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return {"rows": a["rows"] + b["rows"], "moments": eda_stats._merge_moments(a["moments"], b["moments"])}
+
+
+# -------------------------------------------------
+# Helper: fit the KNN model on the current reference set
+# -------------------------------------------------
+def _fit_model(state):
+    size = state["size"]
+    # Brute force only stores the reference arrays (no tree to rebuild)
+    state["model"] = KNeighborsClassifier(algorithm='brute', **state["best_params"])
+    state["model"].fit(state["X_scaled"][:size], state["y"][:size])
+
+
+# -------------------------------------------------
+# Helper: rescale the whole history and run the grid search again
+# -------------------------------------------------
+def _tune(state):
+    size = state["size"]
+    state["reference_scaler"] = copy.deepcopy(state["scaler"])
+    state["X_scaled"][:size] = state["reference_scaler"].transform(state["X_raw"][:size])
+
+    grid_search = GridSearchCV(
+        estimator=KNeighborsClassifier(algorithm='brute'),
+        param_grid=state["param_grid"],
+        cv=CV_FOLDS,
+        scoring='accuracy',
+        n_jobs=-1
+    )
+    grid_search.fit(state["X_scaled"][:size], state["y"][:size])
+
+    state["best_params"] = grid_search.best_params_
+    state["best_score"] = grid_search.best_score_
+    state["reference_stats"] = state["history_stats"]
+    state["since_tune_stats"] = None
+    state["tune_count"] += 1
+    _fit_model(state)
+
+
+# -------------------------------------------------
+# Train from scratch (first run)
+# -------------------------------------------------
+def start_training(X, y, param_grid=PARAM_GRID_KNN):
+    X_raw = X.to_numpy(dtype=np.float64)
+
+    state = {
+        "columns": list(X.columns),
+        "param_grid": param_grid,
+        "scaler": StandardScaler().partial_fit(X_raw),
+        "X_raw": X_raw.copy(),
+        "X_scaled": np.empty_like(X_raw),
+        "y": np.asarray(y).copy(),
+        "size": len(X_raw),
+        "history_stats": _batch_stats(X),
+        "tune_count": 0,
+    }
+    _tune(state)
+
+    print(f"Trained on {state['size']} row(s). Best parameters: {state['best_params']} "
+          f"(CV accuracy {state['best_score']:.4f})")
+    return state
+
+
+# -------------------------------------------------
+# Helper: largest standardized mean shift of `new_stats` vs `reference_stats`
+# -------------------------------------------------
+def _mean_shift(reference_stats, new_stats):
+    if new_stats is None or new_stats["rows"] < MIN_DRIFT_ROWS:
+        return 0.0
+
+    reference = reference_stats["moments"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        reference_std = np.sqrt(reference["m2"] / (reference["count"] - 1))
+        shift = np.abs(new_stats["moments"]["mean"] - reference["mean"]) / reference_std
+
+    shift = np.where(reference_std > 0, shift, 0.0)
+    return float(np.max(shift))
+
+
+# -------------------------------------------------
+# Drift of the latest batch, and of all rows added since the last tuning,
+# against the data the model was tuned on
+# -------------------------------------------------
+def drift_score(state, batch_stats=None):
+    return max(_mean_shift(state["reference_stats"], batch_stats),
+               _mean_shift(state["reference_stats"], state["since_tune_stats"]))
+
+
+# -------------------------------------------------
+# Add newly arrived rows (cost grows with the batch, not the history)
+# -------------------------------------------------
+def update_training(state, X_new, y_new, drift_threshold=DRIFT_THRESHOLD):
+    if list(X_new.columns) != state["columns"]:
+        raise ValueError("New rows must have the same columns as the training data.")
+
+    rows = X_new.to_numpy(dtype=np.float64)
+    size = state["size"]
+
+    state["scaler"].partial_fit(rows)
+    state["X_raw"] = _append_rows(state["X_raw"], size, rows)
+    state["X_scaled"] = _append_rows(state["X_scaled"], size, state["reference_scaler"].transform(rows))
+    state["y"] = _append_rows(state["y"], size, np.asarray(y_new))
+    state["size"] = size + len(rows)
+
+    batch_stats = _batch_stats(X_new)
+    state["history_stats"] = _merge_stats(state["history_stats"], batch_stats)
+    state["since_tune_stats"] = _merge_stats(state["since_tune_stats"], batch_stats)
+
+    drift = drift_score(state, batch_stats)
+    retuned = drift > drift_threshold
+    if retuned:
+        _tune(state)
+    else:
+        _fit_model(state)
+
+    print(f"Added {len(rows)} row(s), {state['size']} in total. Drift: {drift:.3f}"
+          f"{' - re-tuned, best parameters: ' + str(state['best_params']) if retuned else ''}")
+    return retuned
+
+
+# -------------------------------------------------
+# Predictions with the current model
+# -------------------------------------------------
+def predict(state, X):
+    return state["model"].predict(state["reference_scaler"].transform(X.to_numpy(dtype=np.float64)))
+
+
+def predict_proba(state, X):
+    return state["model"].predict_proba(state["reference_scaler"].transform(X.to_numpy(dtype=np.float64)))
+
+
+# -------------------------------------------------
+# Benchmark: full retrain vs incremental update
+# -------------------------------------------------
+def benchmark_incremental(path, history_rows=20_000, batch_rows=(500, 2_000, 8_000), param_grid=None):
+    if param_grid is None:
+        param_grid = {'n_neighbors': [5, 9, 15], 'weights': ['uniform', 'distance'], 'metric': ['euclidean']}
+
+    data = pd.read_csv(path, encoding="utf-8-sig")
+    history = data.sample(n=history_rows, replace=True, random_state=42)
+    X_history, y_history = history.drop('target', axis=1), history['target']
+
+    results = []
+    for rows in batch_rows:
+        batch = data.sample(n=rows, replace=True, random_state=rows)
+        X_batch, y_batch = batch.drop('target', axis=1), batch['target']
+
+        start = time.perf_counter()
+        start_training(pd.concat([X_history, X_batch]), pd.concat([y_history, y_batch]), param_grid)
+        full_seconds = time.perf_counter() - start
+
+        state = start_training(X_history, y_history, param_grid)
+        start = time.perf_counter()
+        update_training(state, X_batch, y_batch)
+        incremental_seconds = time.perf_counter() - start
+
+        results.append({'New Rows': rows, 'Full Retrain (s)': round(full_seconds, 3),
+                        'Incremental (s)': round(incremental_seconds, 3)})
+
+    results_df = pd.DataFrame(results)
+    print(f"\nBenchmark with {history_rows} historical row(s):")
+    print(results_df.to_string(index=False))
+    return results_df
+
+
+if __name__ == "__main__":
+    benchmark_incremental(sys.argv[1] if len(sys.argv) > 1 else "../Datasets/heart_disease.csv")